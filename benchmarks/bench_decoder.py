@@ -0,0 +1,37 @@
+"""Benchmark the JSON backends on a synthetic 2000 rows tabular report body.
+
+Run it from the repository root with `make bench`.
+"""
+import json
+import timeit
+
+from pathlib import Path
+
+from reportforce.helpers import decoder
+
+DATA = Path(__file__).resolve().parent.parent / "tests" / "data"
+N_ROWS = 2000
+REPEAT = 5
+
+
+def make_tabular_body(n_rows=N_ROWS):
+    with open(DATA / "tabular.json") as f:
+        report = json.load(f)
+
+    rows = report["factMap"]["T!T"]["rows"]
+    report["factMap"]["T!T"]["rows"] = rows * n_rows
+
+    return json.dumps(report).encode()
+
+
+def bench(name, loads, content):
+    seconds = min(timeit.repeat(lambda: loads(content), number=1, repeat=REPEAT))
+    print(f"{name:<30}{seconds * 1000:>10.2f} ms")
+
+
+if __name__ == "__main__":
+    body = make_tabular_body()
+
+    print(f"Tabular report body with {N_ROWS} rows ({len(body) / 1024:.0f} KiB)")
+    for name, loads in decoder.backends.items():
+        bench(name, loads, body)
@@ -0,0 +1,111 @@
+"""Benchmark the report parsers on a synthetic 2000 rows tabular page, and
+the grouping index of a synthetic summary report with 100000 groups.
+
+Run it from the repository root with `make bench`.
+"""
+import copy
+import json
+import timeit
+import itertools
+import pandas as pd
+
+from pathlib import Path
+
+from reportforce.helpers import parsers
+from reportforce.helpers.tabular import Tabular
+
+DATA = Path(__file__).resolve().parent.parent / "tests" / "data"
+N_ROWS = 2000
+REPEAT = 5
+GROUPS_PER_LEVEL = (40, 50, 50)
+
+
+def make_tabular_page(n_rows=N_ROWS):
+    with open(DATA / "tabular.json") as f:
+        report = Tabular(json.load(f))
+
+    row = report["factMap"]["T!T"]["rows"][0]
+    report["factMap"]["T!T"]["rows"] = [copy.deepcopy(row) for _ in range(n_rows)]
+
+    return report
+
+
+def cell_by_cell(report):
+    dtypes = report.get_columns_dtypes()
+    cells = [
+        [parsers.get_value(cell, dtype) for cell, dtype in zip(row["dataCells"], dtypes)]
+        for row in report.rows
+    ]
+    return pd.DataFrame(cells, columns=report.get_columns_labels())
+
+
+def column_by_column(report):
+    return report.to_dataframe()
+
+
+def make_groupings(groups_per_level=GROUPS_PER_LEVEL, depth=0):
+    if depth == len(groups_per_level):
+        return []
+
+    return [
+        {
+            "label": "group{}_{}".format(depth, i),
+            "groupings": make_groupings(groups_per_level, depth + 1),
+        }
+        for i in range(groups_per_level[depth])
+    ]
+
+
+def get_groups_labels(groups, groupings_labels):
+    """Labels of every group, for every level of nesting, as the summary
+    parser used to get them."""
+    labels = []
+    nested_groupings = []
+
+    for group in groups:
+        labels.append(group["label"])
+        nested_groupings.extend(group["groupings"])
+
+    groupings_labels.append(labels)
+    if nested_groupings:
+        get_groups_labels(nested_groupings, groupings_labels)
+
+    return groupings_labels
+
+
+def get_groups(groups):
+    """Cartesian product of the labels under each top level group."""
+    all_groups = []
+    for group in groups:
+        all_groups.extend(itertools.product(*get_groups_labels([group], [])))
+    return all_groups
+
+
+def index_from_tuples(groupings):
+    return pd.MultiIndex.from_tuples(get_groups(groupings))
+
+
+def index_from_codes(groupings):
+    return pd.MultiIndex(*parsers.get_groups_levels(groupings, len(GROUPS_PER_LEVEL)))
+
+
+def bench(name, func, *args):
+    seconds = min(timeit.repeat(lambda: func(*args), number=1, repeat=REPEAT))
+    print(f"{name:<30}{seconds * 1000:>10.2f} ms")
+    return seconds
+
+
+if __name__ == "__main__":
+    page = make_tabular_page()
+
+    print(f"Tabular page with {N_ROWS} rows")
+    baseline = bench("cell by cell", cell_by_cell, page)
+    columnar = bench("column by column", column_by_column, page)
+    print(f"{'speedup':<30}{baseline / columnar:>10.2f} x")
+
+    groupings = make_groupings()
+
+    print(f"\nGrouping index with {len(GROUPS_PER_LEVEL)} levels")
+    baseline = bench("from tuples", index_from_tuples, groupings)
+    codes = bench("from levels and codes", index_from_codes, groupings)
+    print(f"{'speedup':<30}{baseline / codes:>10.2f} x")
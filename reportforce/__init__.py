@@ -1 +1,4 @@
 from reportforce.api import Reportforce  # noqa: F401
+from reportforce.aio import AsyncReportforce  # noqa: F401
+from reportforce.helpers.cache import MetadataCache, ReportCache  # noqa: F401
+from reportforce.helpers.scheduler import Scheduler  # noqa: F401
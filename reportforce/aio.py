@@ -0,0 +1,416 @@
+import time
+import asyncio
+import warnings
+import functools
+import pandas as pd
+
+from concurrent.futures import ThreadPoolExecutor
+
+from .api import INSTANCE_TIMEOUT, POLL_INITIAL_DELAY, POLL_MAX_DELAY, Reportforce
+from .helpers import arrow, decoder, sinks, utils
+from .helpers.dtypes import check_dtypes, convert_dtypes
+from .helpers.pagination import get_paginator
+from .helpers.session import DEFAULT_POOL_SIZE
+from .helpers.store import ReportStore
+
+DEFAULT_MAX_CONCURRENCY = 8
+
+
+class AsyncReportforce(Reportforce):
+    """Asyncio counterpart of Reportforce.
+
+    Every HTTP request, and the parsing of every page, is run in a thread
+    pool bounded by `max_concurrency`, so that many reports can be in flight
+    at once on a single event loop without blocking it.
+
+    Attributes
+    ----------
+    max_concurrency : int, default 8
+        Maximum number of concurrent HTTP requests. The session connection
+        pool is made at least as big.
+
+    Methods
+    -------
+    get_report : coroutine
+        Get a report as a DataFrame.
+
+    get_metadata : coroutine
+        Get a report metadata.
+
+    Examples
+    --------
+    >>> async def main():
+    ...     async with AsyncReportforce("user", "pass", "token") as rf:
+    ...         return await asyncio.gather(
+    ...             rf.get_report("00O1a000001YtFG"), rf.get_report("00O1a000001YtFH")
+    ...         )
+    """
+
+    def __init__(self, *args, max_concurrency=DEFAULT_MAX_CONCURRENCY, **kwargs):
+        # keep a connection for every concurrent request
+        pool_size = max(kwargs.pop("pool_size", DEFAULT_POOL_SIZE), max_concurrency)
+        super().__init__(*args, pool_size=pool_size, **kwargs)
+
+        self.max_concurrency = max_concurrency
+        self._executor = ThreadPoolExecutor(max_workers=max_concurrency)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        self._executor.shutdown(wait=False)
+
+    async def _run(self, func, *args, **kwargs):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executor, functools.partial(func, *args, **kwargs)
+        )
+
+    async def get_report(
+        self,
+        report_id,
+        id_column=None,
+        date_column=None,
+        start=None,
+        end=None,
+        date_interval=None,
+        ignore_date_filter=False,
+        filters=[],
+        logic=None,
+        excel=None,
+        date_windows=None,
+        dtypes=None,
+        use_cache=True,
+        refresh_cache=False,
+        sink=None,
+        output="pandas",
+        excel_as_dataframe=False,
+        columns=None,
+        **kwargs,
+    ):
+        """Coroutine to get a Salesforce report into a DataFrame.
+
+        It accepts the same parameters as Reportforce.get_report.
+        """
+        check_dtypes(dtypes)
+        arrow.check_output(output)
+
+        url, metadata = await self._prepare_report(
+            report_id,
+            date_column=date_column,
+            start=start,
+            end=end,
+            date_interval=date_interval,
+            ignore_date_filter=ignore_date_filter,
+            filters=filters,
+            logic=logic,
+            columns=columns,
+            id_column=id_column,
+        )
+
+        if excel:
+            return await self._run(
+                self._save_spreadsheet, url, metadata, excel, **kwargs
+            )
+
+        if excel_as_dataframe:
+            report = await self._run(self._read_spreadsheet, url, metadata, **kwargs)
+            return await self._run(convert_dtypes, report, metadata, dtypes)
+
+        if sink is not None:
+            pages = self._iter_pages(url, metadata, id_column, date_windows, **kwargs)
+            return await self._write_pages(sinks.get_sink(sink, metadata), pages)
+
+        if output == "arrow":
+            pages = self._iter_pages(
+                url, metadata, id_column, date_windows, output, **kwargs
+            )
+            return arrow.concat([table async for table in pages])
+
+        cache_key = self._get_cache_key(
+            report_id,
+            metadata,
+            id_column=id_column,
+            date_windows=date_windows,
+            dtypes=dtypes,
+        )
+
+        if use_cache and not refresh_cache and cache_key is not None:
+            report = await self._run(self.report_cache.get, cache_key)
+            if report is not None:
+                return report
+
+        reports = self._iter_pages(url, metadata, id_column, date_windows, **kwargs)
+        pages = [df async for df in reports]
+
+        report = await self._run(self._concat_pages, pages, metadata, dtypes)
+
+        if use_cache and cache_key is not None:
+            await self._run(self.report_cache.set, cache_key, report)
+
+        return report
+
+    async def iter_report(
+        self,
+        report_id,
+        id_column=None,
+        date_column=None,
+        start=None,
+        end=None,
+        date_interval=None,
+        ignore_date_filter=False,
+        filters=[],
+        logic=None,
+        date_windows=None,
+        dtypes=None,
+        columns=None,
+        **kwargs,
+    ):
+        """Asynchronous generator of a Salesforce report DataFrames, one for
+        each page, as they arrive.
+
+        It accepts the same parameters as Reportforce.iter_report.
+
+        Examples
+        --------
+        >>> async for df in rf.iter_report("00O1a000001YtFG", id_column="Case Number"):
+        ...     df.to_csv("report.csv", mode="a")
+        """
+        check_dtypes(dtypes)
+
+        url, metadata = await self._prepare_report(
+            report_id,
+            date_column=date_column,
+            start=start,
+            end=end,
+            date_interval=date_interval,
+            ignore_date_filter=ignore_date_filter,
+            filters=filters,
+            logic=logic,
+            columns=columns,
+            id_column=id_column,
+        )
+        reports = self._iter_pages(url, metadata, id_column, date_windows, **kwargs)
+
+        async for df in reports:
+            yield await self._run(convert_dtypes, df, metadata, dtypes)
+
+    async def get_reports(self, reports, progress=None):
+        """Coroutine to get many reports at once, as many at the same time as
+        max_concurrency allows.
+
+        It accepts the same parameters as Reportforce.get_reports, except
+        max_workers.
+        """
+        names, reports = self._get_reports_names(reports)
+        results = {}
+
+        async def get_report(name, report):
+            try:
+                results[name] = await self.get_report(**report)
+            except Exception as error:
+                results[name] = error
+
+            if progress is not None:
+                progress(name, len(results), len(reports))
+
+        await asyncio.gather(*map(get_report, names, reports))
+
+        return {name: results[name] for name in names}
+
+    async def aggregate_report(
+        self, report_id, down, across=None, aggregates=("count",), **options
+    ):
+        """Coroutine to get a report aggregated by Salesforce.
+
+        It accepts the same parameters as Reportforce.aggregate_report.
+        """
+        url, metadata = await self._prepare_report(report_id, **options)
+        metadata.group_by(down, across, aggregates)
+
+        report = await self._run(
+            self._get_report, url, metadata, self._get_parser(metadata)
+        )
+        return await self._run(report.to_dataframe)
+
+    async def sync_report(
+        self, report_id, path, id_column, modified_column, table=None, **kwargs
+    ):
+        """Coroutine to keep a local copy of a report up to date, getting only
+        the rows modified since the last time it was synced.
+
+        It accepts the same parameters as Reportforce.sync_report.
+        """
+        store = await self._run(ReportStore, path, table or report_id)
+        high_water_mark = await self._run(lambda: store.high_water_mark)
+        kwargs = self._get_sync_options(high_water_mark, modified_column, kwargs)
+
+        report = await self.get_report(
+            report_id, id_column=id_column, use_cache=False, **kwargs
+        )
+        await self._run(store.upsert, report, id_column, modified_column)
+
+        return report
+
+    async def submit_report(self, report_id, **options):
+        """Coroutine to run a report asynchronously, returning the ID of its
+        instance.
+
+        It accepts the same parameters as Reportforce.submit_report.
+        """
+        _, metadata = await self._prepare_report(report_id, **options)
+
+        response = await self._run(
+            self.session.post,
+            self._get_instances_url(report_id),
+            json=metadata.payload,
+        )
+        return decoder.decode(response)["id"]
+
+    async def get_instance(
+        self, report_id, instance_id, timeout=INSTANCE_TIMEOUT, dtypes=None
+    ):
+        """Coroutine to wait for an asynchronous report run to finish and get
+        it into a DataFrame, without blocking the event loop while waiting.
+
+        It accepts the same parameters as Reportforce.get_instance.
+        """
+        check_dtypes(dtypes)
+
+        url = self._get_instances_url(report_id, instance_id)
+        deadline = time.monotonic() + timeout
+
+        for delay in utils.backoff_delays(POLL_INITIAL_DELAY, POLL_MAX_DELAY):
+            instance = decoder.decode(await self._run(self.session.get, url))
+            if self._is_instance_finished(instance):
+                break
+
+            self._check_instance_deadline(instance_id, deadline, delay)
+            await asyncio.sleep(delay)
+
+        return await self._run(self._parse_instance, instance, dtypes)
+
+    @staticmethod
+    def _concat_pages(pages, metadata, dtypes):
+        report = pd.concat(pages)
+        report = convert_dtypes(report, metadata, dtypes)
+        return utils.reset_useless_index(report)
+
+    async def _write_pages(self, sink, pages):
+        n_rows = 0
+
+        try:
+            async for df in pages:
+                await self._run(sink.write, df)
+                n_rows += len(df)
+        finally:
+            sink.close()
+
+        return n_rows
+
+    def _iter_pages(
+        self,
+        url,
+        metadata,
+        id_column=None,
+        date_windows=None,
+        output="pandas",
+        **kwargs,
+    ):
+        parser = self._get_parser(metadata)
+
+        if date_windows:
+            return self._generate_windows(
+                url, metadata, parser, date_windows, id_column, output, **kwargs
+            )
+
+        return self._generate_reports(
+            url, metadata, parser, id_column, output, **kwargs
+        )
+
+    async def _prepare_report(self, report_id, **options):
+        url = self._get_report_url(report_id)
+
+        metadata = (await self.get_metadata(report_id)).overlay()
+        self._set_options(metadata, **options)
+
+        return url, metadata
+
+    async def get_metadata(self, report_id):
+        return await self._run(super().get_metadata, report_id)
+
+    async def _generate_reports(
+        self, url, metadata, parser, id_column=None, output="pandas", **kwargs
+    ):
+        if id_column is not None:
+            paginator = get_paginator(metadata, id_column)
+
+        report = await self._run(self._get_report, url, metadata, parser, **kwargs)
+        df = await self._run(report.to_page, output)
+        yield df
+
+        while not report.all_data and id_column:
+            paginator.update(df)
+
+            report = await self._run(self._get_report, url, metadata, parser, **kwargs)
+            page = await self._run(report.to_page, output)
+            df = await self._run(paginator.drop_seen, page)
+            yield df
+
+    async def _generate_windows(
+        self,
+        url,
+        metadata,
+        parser,
+        date_windows,
+        id_column=None,
+        output="pandas",
+        **kwargs,
+    ):
+        windows = utils.split_date_range(*metadata.date_range, date_windows)
+
+        async def get_window(window):
+            window_metadata = self._get_window_metadata(metadata, *window)
+            return await self._run(
+                self._get_report, url, window_metadata, parser, **kwargs
+            )
+
+        tasks = {
+            window: asyncio.ensure_future(get_window(window)) for window in windows
+        }
+        reports = {}
+
+        try:
+            while windows:
+                window = windows[0]
+
+                if window not in reports:
+                    done, _ = await asyncio.wait(
+                        tasks.values(), return_when=asyncio.FIRST_COMPLETED
+                    )
+                    for split in self._split_truncated_windows(
+                        windows, tasks, reports, done
+                    ):
+                        tasks[split] = asyncio.ensure_future(get_window(split))
+                    continue
+
+                report = reports.pop(windows.pop(0))
+                df = await self._run(report.to_page, output)
+
+                if report.all_data:
+                    yield df
+                elif id_column:
+                    window_metadata = self._get_window_metadata(metadata, *window)
+                    async for df in self._generate_reports(
+                        url, window_metadata, parser, id_column, output, **kwargs
+                    ):
+                        yield df
+                else:
+                    warnings.warn(self._truncated_window_warning(window))
+                    yield df
+        finally:
+            for task in tasks.values():
+                task.cancel()
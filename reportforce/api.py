@@ -1,21 +1,42 @@
+import io
 import re
-import copy
-import requests
+import time
+import datetime
+import warnings
 import functools
 import pandas as pd
 
 from urllib.parse import urljoin
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, as_completed, wait
 
 from .login import Salesforce
 
-from .helpers import errors, utils
+from .helpers import arrow, decoder, errors, excel as spreadsheets, sinks, utils
+from .helpers.dtypes import check_dtypes, convert_dtypes
 from .helpers.metadata import Metadata
+from .helpers.pagination import get_paginator
+from .helpers.scheduler import DEFAULT_PRIORITY, get_scheduler
+from .helpers.session import (
+    DEFAULT_MAX_RETRIES,
+    DEFAULT_POOL_SIZE,
+    ScheduledSession,
+    get_pool_size,
+    grow_pool,
+    make_session,
+)
+from .helpers.store import ReportStore
 from .helpers.tabular import Tabular
 from .helpers.matrix import Matrix
 from .helpers.summary import Summary
 
 URL = "https://{}/services/data/v{}/analytics/reports/"
 
+INSTANCE_TIMEOUT = 600
+POLL_INITIAL_DELAY = 1
+POLL_MAX_DELAY = 30
+
+DEFAULT_MAX_WORKERS = 8
+
 
 class Reportforce(Salesforce):
     """Class to interact with the Salesforce Analytics API.
@@ -26,28 +47,90 @@ class Reportforce(Salesforce):
         Salesforce instance/server URL.
 
     session : requests.Session
-        Session used for making http requests.
+        Session used for making http requests, owned by this instance. If not
+        given, one is made with a connection pool of pool_size connections,
+        which retries failed requests up to max_retries times.
+
+    scheduler : Scheduler (optional)
+        Scheduler keeping synchronous report runs under the org rate and
+        concurrency limits, shared by every client of the same instance unless
+        one is given. Report runs take a `priority` keyword argument, e.g. in
+        get_report, and lower numbers run first. It is not used by a custom
+        session, which ignores priorities.
+
+    metadata_cache : MetadataCache (optional)
+        On-disk cache of reports metadata, shared across runs and processes.
+
+    report_cache : ReportCache (optional)
+        On-disk cache of reports DataFrames, used by get_report.
 
     Methods
     -------
     get_report : pandas.DataFrame
         Get a report as a DataFrame.
 
+    iter_report : iterator of pandas.DataFrame
+        Get a report as DataFrames, one for each page.
+
+    get_reports : dict
+        Get many reports at once, as DataFrames.
+
+    aggregate_report : pandas.DataFrame
+        Get a report aggregated by Salesforce.
+
     get_total : int, float
         Get the grand total of a report.
 
     get_metadata : dict
         Get a report metadata.
+
+    invalidate_metadata : None
+        Forget a cached report metadata.
+
+    sync_report : pandas.DataFrame
+        Update a local copy of a report with the rows changed since last time.
+
+    submit_report : str
+        Run a report asynchronously, returning the ID of its instance.
+
+    get_instance : pandas.DataFrame
+        Wait for an asynchronous report run to finish and get it as a DataFrame.
     """
 
-    session = requests.Session()
-    session.hooks["response"].append(errors.handle_error)
+    metadata_cache = None
+    report_cache = None
 
-    def __init__(self, *args, **kwargs):
+    def __init__(
+        self,
+        *args,
+        metadata_cache=None,
+        report_cache=None,
+        session=None,
+        pool_size=DEFAULT_POOL_SIZE,
+        max_retries=DEFAULT_MAX_RETRIES,
+        keep_alive=True,
+        scheduler=None,
+        **kwargs,
+    ):
         super().__init__(*args, **kwargs)
 
         self.url = URL.format(self.instance_url, self.version)
+        self._owns_session = session is None
+
+        if session is None:
+            session = make_session(
+                pool_size=pool_size,
+                max_retries=max_retries,
+                keep_alive=keep_alive,
+                scheduler=scheduler or get_scheduler(self.instance_url),
+            )
+        if errors.handle_error not in session.hooks["response"]:
+            session.hooks["response"].append(errors.handle_error)
+
+        self.session = session
         self.session.headers.update(self.headers)
+        self.metadata_cache = metadata_cache
+        self.report_cache = report_cache
 
     def _get_report_url(self, report_id):
         return urljoin(self.url, report_id)
@@ -64,6 +147,14 @@ class Reportforce(Salesforce):
         filters=[],
         logic=None,
         excel=None,
+        date_windows=None,
+        dtypes=None,
+        use_cache=True,
+        refresh_cache=False,
+        sink=None,
+        output="pandas",
+        excel_as_dataframe=False,
+        columns=None,
         **kwargs,
     ):
         """Function to get a Salesforce report into a DataFrame.
@@ -74,8 +165,9 @@ class Reportforce(Salesforce):
             A report unique identifier.
 
         id_column : str (optional)
-            Column name which has unique values for each row. This is needed as
-            a workaround to the Analytics API's 2000 row limitation.
+            Name of a sortable column, preferably with unique values for each
+            row, used to paginate the report. This is needed as a workaround to
+            the Analytics API's 2000 row limitation.
 
         date_column : str (optional)
             Date column name.
@@ -104,90 +196,769 @@ class Reportforce(Salesforce):
             non-empty string is passed, it will be used as the filename. If True,
             the workbook will be automatically named.
 
+        date_windows : int (optional)
+            Number of windows in which to split the standard date filter range,
+            to be requested at the same time. Windows that still exceed the 2000
+            row limit are split in half until they fit. This is an alternative
+            workaround to the 2000 row limitation.
+
+        dtypes : str (optional)
+            If "compact", convert the columns into memory-efficient dtypes
+            according to their data type in the report metadata: strings and
+            picklists into categoricals, integers into nullable integers,
+            booleans into nullable booleans and dates into datetime64.
+
+        use_cache : bool, default True
+            Whether or not to use the report cache, if there is one.
+
+        refresh_cache : bool, default False
+            Whether or not to get the report again even if it is in the report
+            cache, storing it there afterwards.
+
+        sink : str, file object (optional)
+            Write every page into this sink as it arrives, instead of returning
+            a DataFrame, under a schema taken from the report metadata. Paths
+            ending with .parquet or .pq are written as Parquet, with a row group
+            per page, anything else as CSV. Only tabular and summary reports
+            are supported, and summary groupings are written as columns.
+
+        output : str, default "pandas"
+            If "arrow", build every page straight into a pyarrow Table, with
+            column types taken from their data type, and concatenate them
+            without copying. Summary groupings become columns, and the report
+            cache and dtypes are not used.
+
+        excel_as_dataframe : bool, default False
+            Whether or not to download the report as an Excel spreadsheet, which
+            is not limited to 2000 rows, and read it in memory into a DataFrame,
+            with columns converted according to their data type. Only tabular
+            reports are supported, and it needs openpyxl to be installed.
+
+        columns : list (optional)
+            Labels of the detail columns to get, instead of every column in
+            the report, so that less data is sent and parsed. The id_column is
+            added if it is missing.
+
         Returns
         -------
-        DataFrame
-            A DataFrame contaning the records from the report.
+        DataFrame, pyarrow.Table
+            A DataFrame contaning the records from the report, or a Table if
+            output is "arrow". If a sink was given, the number of rows written
+            into it instead.
 
         Raises
         ------
         ReportError
             If there is an error-like JSON string in the reponse body.
         """
-        self.report_url = self._get_report_url(report_id)
+        check_dtypes(dtypes)
+        arrow.check_output(output)
+
+        url, metadata = self._prepare_report(
+            report_id,
+            date_column=date_column,
+            start=start,
+            end=end,
+            date_interval=date_interval,
+            ignore_date_filter=ignore_date_filter,
+            filters=filters,
+            logic=logic,
+            columns=columns,
+            id_column=id_column,
+        )
+
+        if excel:
+            return self._save_spreadsheet(url, metadata, excel, **kwargs)
+
+        if excel_as_dataframe:
+            report = self._read_spreadsheet(url, metadata, **kwargs)
+            return convert_dtypes(report, metadata, dtypes)
+
+        if sink is not None:
+            pages = self._iter_pages(url, metadata, id_column, date_windows, **kwargs)
+            return sinks.write_pages(sinks.get_sink(sink, metadata), pages)
+
+        if output == "arrow":
+            pages = self._iter_pages(
+                url, metadata, id_column, date_windows, output, **kwargs
+            )
+            return arrow.concat(pages)
+
+        cache_key = self._get_cache_key(
+            report_id,
+            metadata,
+            id_column=id_column,
+            date_windows=date_windows,
+            dtypes=dtypes,
+        )
+
+        if use_cache and not refresh_cache and cache_key is not None:
+            report = self.report_cache.get(cache_key)
+            if report is not None:
+                return report
+
+        report = pd.concat(
+            self._iter_pages(url, metadata, id_column, date_windows, **kwargs)
+        )
+        report = convert_dtypes(report, metadata, dtypes)
+        report = utils.reset_useless_index(report)
+
+        if use_cache and cache_key is not None:
+            self.report_cache.set(cache_key, report)
+
+        return report
+
+    def iter_report(
+        self,
+        report_id,
+        id_column=None,
+        date_column=None,
+        start=None,
+        end=None,
+        date_interval=None,
+        ignore_date_filter=False,
+        filters=[],
+        logic=None,
+        date_windows=None,
+        dtypes=None,
+        columns=None,
+        **kwargs,
+    ):
+        """Function to get a Salesforce report as DataFrames, one for each
+        page, as they arrive.
+
+        It accepts the same parameters as get_report, except excel. This is
+        useful to write, aggregate or discard every page without holding the
+        entire report in memory. With dtypes="compact", the categories of
+        each page are the values in that page only.
+
+        Yields
+        ------
+        DataFrame
+            A DataFrame containing the records from a page of the report.
+
+        Examples
+        --------
+        >>> for df in rf.iter_report("00O1a000001YtFG", id_column="Case Number"):
+        ...     df.to_csv("report.csv", mode="a")
+        """
+        check_dtypes(dtypes)
+
+        url, metadata = self._prepare_report(
+            report_id,
+            date_column=date_column,
+            start=start,
+            end=end,
+            date_interval=date_interval,
+            ignore_date_filter=ignore_date_filter,
+            filters=filters,
+            logic=logic,
+            columns=columns,
+            id_column=id_column,
+        )
+        reports = self._iter_pages(url, metadata, id_column, date_windows, **kwargs)
+
+        for report in reports:
+            yield convert_dtypes(report, metadata, dtypes)
+
+    def _iter_pages(
+        self,
+        url,
+        metadata,
+        id_column=None,
+        date_windows=None,
+        output="pandas",
+        **kwargs,
+    ):
         self.id_column = id_column
+        self.parser = self._get_parser(metadata)
+
+        if date_windows:
+            return self._generate_windows(
+                url, metadata, self.parser, date_windows, id_column, output, **kwargs
+            )
+
+        return self._generate_reports(
+            url, metadata, self.parser, id_column, output, **kwargs
+        )
+
+    def get_reports(self, reports, max_workers=DEFAULT_MAX_WORKERS, progress=None):
+        """Function to get many reports at once, each in a thread of a bounded
+        pool, sharing this instance's session.
+
+        Parameters
+        ----------
+        reports : list
+            Either report IDs or dictionaries with a "report_id" key, an
+            optional "name" key and any other parameter accepted by
+            get_report, e.g. filters.
+
+        max_workers : int, default 8
+            Maximum number of reports requested at the same time. The
+            connection pool of a session made by this instance grows to fit
+            them, while a warning is issued if a session given to it pools
+            fewer connections.
+
+        progress : callable (optional)
+            Called with the name of a report, the number of reports finished
+            so far and the total number of reports, whenever one finishes.
+
+        Returns
+        -------
+        dict
+            A dictionary mapping each report name, or ID if it has no name, to
+            its DataFrame, or to the exception raised while getting it.
+
+        Raises
+        ------
+        ValueError
+            If two reports have the same name.
+
+        Examples
+        --------
+        >>> rf.get_reports(
+        ...     [
+        ...         "00O1a000001YtFG",
+        ...         {"report_id": "00O1a000001YtFH", "name": "cases", "start": "01-01-2020"},
+        ...     ],
+        ...     progress=lambda name, done, total: print(name, done, total),
+        ... )
+        """
+        names, reports = self._get_reports_names(reports)
+        results = {}
+
+        self._fit_pool(max_workers)
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(self.get_report, **report): name
+                for name, report in zip(names, reports)
+            }
+
+            for future in as_completed(futures):
+                name = futures[future]
+                try:
+                    results[name] = future.result()
+                except Exception as error:
+                    results[name] = error
+
+                if progress is not None:
+                    progress(name, len(results), len(futures))
+
+        return {name: results[name] for name in names}
+
+    def _fit_pool(self, size):
+        """Make sure that size requests at once do not overflow the connection
+        pool, in which case urllib3 discards the extra connections instead of
+        reusing them."""
+        if self._owns_session:
+            grow_pool(self.session, self.url, size)
+            return
+
+        pool_size = get_pool_size(self.session, self.url)
+        if pool_size is not None and pool_size < size:
+            warnings.warn(
+                "The session pools {} connections, fewer than the {} reports "
+                "requested at once, so connections will not be reused.".format(
+                    pool_size, size
+                )
+            )
+
+    @staticmethod
+    def _get_reports_names(reports):
+        """Split a list of reports given to get_reports into their names and
+        the parameters to get each of them."""
+        reports = [
+            {"report_id": report} if isinstance(report, str) else dict(report)
+            for report in reports
+        ]
+        names = [report.pop("name", report["report_id"]) for report in reports]
+
+        if len(set(names)) < len(names):
+            raise ValueError("Reports must have unique names, got {}".format(names))
+
+        return names, reports
+
+    def aggregate_report(
+        self, report_id, down, across=None, aggregates=("count",), **options
+    ):
+        """Function to get a report aggregated by Salesforce, instead of
+        getting every row to aggregate them afterwards.
+
+        The report is run without detail rows, as a summary report, or as a
+        matrix report if there are groupings across, with the given groupings
+        and aggregates.
+
+        Parameters
+        ----------
+        report_id : str
+            A report unique identifier.
+
+        down : list
+            Columns to group by, each either a label or a tuple of a label and
+            a date granularity: "Day", "Week", "Month", "Quarter", "Year",
+            "FiscalQuarter" or "FiscalYear".
+
+        across : list (optional)
+            Columns to group by across, in the same format as down.
+
+        aggregates : list, default ["count"]
+            Aggregates to get for each group, each either "count", a tuple of
+            a function ("sum", "mean", "min", "max" or "unique") and a label,
+            or an aggregate API name, e.g. "s!AMOUNT".
+
+        **options
+            Filters and dates accepted by get_report: date_column, start, end,
+            date_interval, ignore_date_filter, filters and logic.
+
+        Returns
+        -------
+        DataFrame
+            A DataFrame with a row for each group down and a column for each
+            aggregate, for each group across if there are any.
+
+        Raises
+        ------
+        ValueError
+            If a column label or aggregate function is unknown.
+
+        Examples
+        --------
+        >>> rf.aggregate_report(
+        ...     "00O1a000001YtFG",
+        ...     down=["Region", ("Close Date", "Month")],
+        ...     aggregates=["count", ("sum", "Amount")],
+        ... )
+        """
+        url, metadata = self._prepare_report(report_id, **options)
+        metadata.group_by(down, across, aggregates)
+
+        return self._get_report(url, metadata, self._get_parser(metadata)).to_dataframe()
+
+    def sync_report(
+        self, report_id, path, id_column, modified_column, table=None, **kwargs
+    ):
+        """Function to keep a local copy of a report up to date, getting only
+        the rows modified since the last time it was synced.
+
+        The rows are upserted into a SQLite table, by the value of id_column.
+        The greatest value of modified_column is remembered and, next time,
+        the standard date filter is set to start from the day before,
+        whatever the org timezone, overriding date_interval and
+        ignore_date_filter.
+
+        Parameters
+        ----------
+        report_id : str
+            A report unique identifier.
+
+        path : str
+            Path to the SQLite database.
+
+        id_column : str
+            Column name which has unique values for each row.
+
+        modified_column : str
+            Date column name telling when a row was last modified.
+
+        table : str (optional)
+            Table name, the report ID by default.
+
+        **kwargs
+            Any other parameter accepted by get_report, e.g. filters.
+
+        Returns
+        -------
+        DataFrame
+            A DataFrame containing the rows modified since the last sync.
+        """
+        store = ReportStore(path, table or report_id)
+        kwargs = self._get_sync_options(store.high_water_mark, modified_column, kwargs)
+
+        report = self.get_report(
+            report_id, id_column=id_column, use_cache=False, **kwargs
+        )
+        store.upsert(report, id_column, modified_column)
+
+        return report
+
+    @staticmethod
+    def _get_sync_options(high_water_mark, modified_column, options):
+        """Set the standard date filter to start from the high-water mark, if
+        there is one, overriding any other date option."""
+        if high_water_mark is None:
+            return options
+
+        options = dict(options)
+        options.pop("ignore_date_filter", None)
+        options.pop("date_interval", None)
+
+        # Salesforce reads dates in the user's timezone, which may be a day
+        # behind the UTC high-water mark, and upserting rows again is harmless
+        one_day = datetime.timedelta(days=1)
+        options.update(
+            date_column=modified_column,
+            start=high_water_mark.date() - one_day,
+            end=max(datetime.date.today(), high_water_mark.date()) + one_day,
+        )
+
+        return options
+
+    def submit_report(self, report_id, **options):
+        """Function to run a report asynchronously, through the report
+        instances endpoint, without waiting for it to finish.
+
+        Many reports can be submitted at once, to run in parallel on the
+        server, and then fetched with get_instance.
+
+        Parameters
+        ----------
+        report_id : str
+            A report unique identifier.
+
+        **options
+            Filters, dates and columns accepted by get_report: date_column,
+            start, end, date_interval, ignore_date_filter, filters, logic and
+            columns.
+
+        Returns
+        -------
+        str
+            The ID of the report instance.
+
+        Examples
+        --------
+        >>> report_ids = ["00O1a000001YtFG", "00O1a000001YtFH"]
+        >>> instances = [rf.submit_report(report_id) for report_id in report_ids]
+        >>> reports = [rf.get_instance(*args) for args in zip(report_ids, instances)]
+        """
+        _, metadata = self._prepare_report(report_id, **options)
+
+        response = self.session.post(
+            self._get_instances_url(report_id), json=metadata.payload
+        )
+        return decoder.decode(response)["id"]
+
+    def get_instance(
+        self, report_id, instance_id, timeout=INSTANCE_TIMEOUT, dtypes=None
+    ):
+        """Function to wait for an asynchronous report run to finish, polling
+        its status with an exponential backoff, and get it into a DataFrame.
+
+        Parameters
+        ----------
+        report_id : str
+            A report unique identifier.
+
+        instance_id : str
+            The report instance ID, as returned by submit_report.
+
+        timeout : int, float, default 600
+            Maximum number of seconds to wait for the report to finish.
+
+        dtypes : str (optional)
+            Same as in get_report.
+
+        Returns
+        -------
+        DataFrame
+            A DataFrame containing the records from the report instance.
+
+        Raises
+        ------
+        ReportError
+            If the report run failed.
+
+        TimeoutError
+            If the report did not finish within timeout seconds.
+        """
+        check_dtypes(dtypes)
+
+        url = self._get_instances_url(report_id, instance_id)
+        deadline = time.monotonic() + timeout
+
+        for delay in utils.backoff_delays(POLL_INITIAL_DELAY, POLL_MAX_DELAY):
+            instance = decoder.decode(self.session.get(url))
+            if self._is_instance_finished(instance):
+                break
+
+            self._check_instance_deadline(instance_id, deadline, delay)
+            time.sleep(delay)
+
+        return self._parse_instance(instance, dtypes)
+
+    def _get_instances_url(self, report_id, instance_id=None):
+        url = self._get_report_url(report_id) + "/instances"
+        if instance_id is not None:
+            url += "/" + instance_id
+        return url
+
+    @staticmethod
+    def _is_instance_finished(instance):
+        attributes = instance["attributes"]
+
+        if attributes["status"] == "Error":
+            raise errors.ReportError(
+                "INSTANCE_ERROR",
+                attributes.get("errorMessage", "The report instance failed."),
+            )
 
-        self.metadata = copy.deepcopy(self.get_metadata(report_id))
+        return attributes["status"] == "Success"
 
-        self.metadata.boolean_filter = logic
-        self.metadata.report_filters = filters
+    @staticmethod
+    def _check_instance_deadline(instance_id, deadline, delay):
+        if time.monotonic() + delay > deadline:
+            raise TimeoutError(
+                "The report instance {} did not finish in time.".format(instance_id)
+            )
+
+    def _parse_instance(self, instance, dtypes=None):
+        metadata = Metadata(instance)
+
+        report = self._get_parser(metadata)(instance).to_dataframe()
+        report = convert_dtypes(report, metadata, dtypes)
+
+        return utils.reset_useless_index(report)
+
+    def _get_cache_key(self, report_id, metadata, **options):
+        """Key of a report in the report cache, which changes whenever the
+        report metadata, after filters and dates were applied, changes."""
+        if self.report_cache is None:
+            return None
+
+        return self.report_cache.get_key(
+            self.instance_url,
+            self.version,
+            report_id,
+            metadata.report_metadata,
+            options,
+        )
+
+    def _prepare_report(self, report_id, **options):
+        url = self._get_report_url(report_id)
+
+        metadata = self.get_metadata(report_id).overlay()
+        self._set_options(metadata, **options)
+
+        # kept for introspection only, since it may be shared by many threads
+        self.report_url, self.metadata = url, metadata
+
+        return url, metadata
+
+    @staticmethod
+    def _set_options(
+        metadata,
+        date_column=None,
+        start=None,
+        end=None,
+        date_interval=None,
+        ignore_date_filter=False,
+        filters=[],
+        logic=None,
+        columns=None,
+        id_column=None,
+    ):
+        metadata.boolean_filter = logic
+        metadata.report_filters = filters
+
+        if columns is not None:
+            columns = list(columns)
+            # pagination needs the id column in every page
+            if id_column is not None and id_column not in columns:
+                columns.append(id_column)
+            metadata.detail_columns = columns
 
         if ignore_date_filter:
-            self.metadata.ignore_date_filter()
+            metadata.ignore_date_filter()
         elif date_interval:
-            self.metadata.set_date_interval(date_interval)
+            metadata.set_date_interval(date_interval)
         else:
             if start:
-                self.metadata.date_start = start
+                metadata.date_start = start
             if end:
-                self.metadata.date_end = end
+                metadata.date_end = end
             if date_column:
-                self.metadata.date_column = date_column
+                metadata.date_column = date_column
             if start or end or date_column:
-                self.metadata.date_interval = "CUSTOM"
+                metadata.date_interval = "CUSTOM"
 
-        if excel:
-            return self._save_spreadsheet(excel)
+    def _get_metadata_url(self, report_id):
+        return self._get_report_url(report_id) + "/describe"
 
-        self.parser = self._get_parser()
-        report = pd.concat(self._generate_reports(**kwargs))
+    def get_metadata(self, report_id):
+        cache = self.metadata_cache
 
-        return utils.reset_useless_index(report)
+        # the metadata cache is read first, so that entries expired or
+        # invalidated by other processes are downloaded again
+        if cache is None:
+            return self._get_metadata(report_id)
 
-    def _get_metadata_url(self, report_id):
-        return self._get_report_url(report_id) + "/describe"
+        key = (self.instance_url, self.version, report_id)
+        metadata = cache.get(*key)
+
+        if metadata is None:
+            metadata = self._download_metadata(report_id)
+            cache.set(*key, metadata)
+
+        return Metadata(metadata)
 
     @functools.lru_cache(maxsize=8)
-    def get_metadata(self, report_id):
+    def _get_metadata(self, report_id):
+        return Metadata(self._download_metadata(report_id))
+
+    def _download_metadata(self, report_id):
         url = self._get_metadata_url(report_id)
+        return decoder.decode(self.session.get(url))
 
-        return Metadata(self.session.get(url).json())
+    def invalidate_metadata(self, report_id):
+        """Forget a report metadata, both in memory and in the metadata cache,
+        so that it is downloaded again next time."""
+        Reportforce._get_metadata.cache_clear()
 
-    def _generate_reports(self, **kwargs):
-        id_column = self.id_column
+        if self.metadata_cache is not None:
+            self.metadata_cache.invalidate(self.instance_url, self.version, report_id)
 
+    def _generate_reports(
+        self, url, metadata, parser, id_column=None, output="pandas", **kwargs
+    ):
         if id_column is not None:
-            update_filter = self.metadata._get_strategy(id_column)
+            paginator = get_paginator(metadata, id_column)
 
-        report = self._get_report(**kwargs)
-        df = report.to_dataframe()
+        report = self._get_report(url, metadata, parser, **kwargs)
+        df = report.to_page(output)
         yield df
 
         while not report.all_data and id_column:
-            update_filter(df, id_column)
+            paginator.update(df)
 
-            report = self._get_report(**kwargs)
-            df = report.to_dataframe()
+            report = self._get_report(url, metadata, parser, **kwargs)
+            df = paginator.drop_seen(report.to_page(output))
             yield df
 
-    def _get_report(self, **kwargs):
-        response = self.session.post(self.report_url, json=self.metadata, **kwargs)
-        return self.parser(response.json())
+    def _generate_windows(
+        self,
+        url,
+        metadata,
+        parser,
+        date_windows,
+        id_column=None,
+        output="pandas",
+        **kwargs,
+    ):
+        windows = utils.split_date_range(*metadata.date_range, date_windows)
+
+        def get_window(window):
+            window_metadata = self._get_window_metadata(metadata, *window)
+            return self._get_report(url, window_metadata, parser, **kwargs)
+
+        with ThreadPoolExecutor(max_workers=len(windows)) as executor:
+            futures = {
+                window: executor.submit(get_window, window) for window in windows
+            }
+            reports = {}
+
+            try:
+                # windows are yielded in date order as soon as they are done,
+                # while the later ones are still being requested
+                while windows:
+                    window = windows[0]
+
+                    if window not in reports:
+                        done, _ = wait(futures.values(), return_when=FIRST_COMPLETED)
+                        for split in self._split_truncated_windows(
+                            windows, futures, reports, done
+                        ):
+                            futures[split] = executor.submit(get_window, split)
+                        continue
+
+                    report = reports.pop(windows.pop(0))
+                    df = report.to_page(output)
+
+                    if report.all_data:
+                        yield df
+                    elif id_column:
+                        window_metadata = self._get_window_metadata(metadata, *window)
+                        yield from self._generate_reports(
+                            url, window_metadata, parser, id_column, output, **kwargs
+                        )
+                    else:
+                        warnings.warn(self._truncated_window_warning(window))
+                        yield df
+            finally:
+                for future in futures.values():
+                    future.cancel()
+
+    @staticmethod
+    def _split_truncated_windows(windows, futures, reports, done):
+        """Store the reports of the done windows that need no further
+        splitting and split the others, which exceeded the row limit, in half
+        in place, returning the new windows to be requested."""
+        splits = []
+
+        for window, future in list(futures.items()):
+            if future not in done:
+                continue
+
+            del futures[window]
+            report = future.result()
+            start, end = window
+
+            if report.all_data or start == end:
+                reports[window] = report
+            else:
+                halves = utils.split_date_range(start, end, 2)
+                position = windows.index(window)
+                windows[position:position + 1] = halves
+                splits.extend(halves)
+
+        return splits
+
+    @staticmethod
+    def _truncated_window_warning(window):
+        return (
+            "Rows from {} exceeded the row limit even in a single day window, "
+            "pass an id_column to get all of them.".format(window[0])
+        )
+
+    @staticmethod
+    def _get_window_metadata(metadata, start, end):
+        window_metadata = metadata.overlay()
+        window_metadata.set_date_window(start, end)
+        return window_metadata
+
+    def _get_run_options(self, options):
+        """Get the request options of a synchronous report run, Excel exports
+        included, which counts against the org report limits and so goes
+        through the scheduler, if the session has one."""
+        options = dict(options)
+
+        if isinstance(self.session, ScheduledSession):
+            options.setdefault("priority", DEFAULT_PRIORITY)
+        else:
+            options.pop("priority", None)
+
+        return options
+
+    def _get_report(self, url, metadata, parser, **kwargs):
+        kwargs = self._get_run_options(kwargs)
+        response = self.session.post(url, json=metadata.payload, **kwargs)
+        return parser(decoder.decode(response))
 
     _parsers = {"TABULAR": Tabular, "MATRIX": Matrix, "SUMMARY": Summary}
 
-    def _get_parser(self):
-        return self._parsers[self.metadata.report_format]
+    def _get_parser(self, metadata):
+        return self._parsers[metadata.report_format]
 
     EXCEL_HEADERS = {
         "Accept": "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
     }
 
-    def _save_spreadsheet(self, excel):
+    def _save_spreadsheet(self, url, metadata, excel, **kwargs):
         excel_headers = self._get_excel_headers()
+        kwargs = self._get_run_options(kwargs)
 
         with self.session.post(
-            self.report_url, headers=excel_headers, json=self.metadata, stream=True
+            url, headers=excel_headers, json=metadata.payload, stream=True, **kwargs
         ) as response:
             if isinstance(excel, str):
                 filename = excel
@@ -200,6 +971,23 @@ class Reportforce(Salesforce):
                     if chunk:
                         spreadsheet.write(chunk)
 
+    def _read_spreadsheet(self, url, metadata, **kwargs):
+        """Download a report spreadsheet into memory and read it into a
+        DataFrame."""
+        spreadsheets.require_openpyxl()
+        excel_headers = self._get_excel_headers()
+        kwargs = self._get_run_options(kwargs)
+        spreadsheet = io.BytesIO()
+
+        with self.session.post(
+            url, headers=excel_headers, json=metadata.payload, stream=True, **kwargs
+        ) as response:
+            for chunk in response.iter_content(chunk_size=512 * 1024):
+                spreadsheet.write(chunk)
+
+        spreadsheet.seek(0)
+        return spreadsheets.read_excel(spreadsheet, metadata)
+
     def _get_excel_headers(self):
         excel_headers = self.session.headers.copy()
         excel_headers.update(self.EXCEL_HEADERS)
@@ -0,0 +1,103 @@
+import pandas as pd
+
+try:
+    import pyarrow as pa
+except ImportError:  # pragma: no cover
+    pa = None
+
+from reportforce.helpers import parsers
+
+
+output_options = ["pandas", "arrow"]
+
+
+def check_output(output):
+    if output not in output_options:
+        raise ValueError(
+            "output must be one of {}, got {!r}".format(output_options, output)
+        )
+    if output == "arrow":
+        require_pyarrow()
+
+
+def require_pyarrow():
+    if pa is None:
+        raise ImportError(
+            "pyarrow is needed for this, install it with "
+            "`pip install reportforce[parquet]`"
+        )
+
+
+def get_arrow_type(dtype):
+    """Get the Arrow type of a column given its Salesforce data type."""
+    if dtype == "int":
+        return pa.int64()
+    elif dtype in ["double", "percent", "currency"]:
+        return pa.float64()
+    elif dtype == "datetime":
+        return pa.timestamp("ns", tz="UTC")
+    elif dtype in parsers.date_types:
+        return pa.timestamp("ns")
+    return pa.string()
+
+
+def get_schema(fields):
+    """Get an Arrow schema from a list of (label, Salesforce data type)."""
+    require_pyarrow()
+    return pa.schema([(label, get_arrow_type(dtype)) for label, dtype in fields])
+
+
+def is_table(obj):
+    return pa is not None and isinstance(obj, pa.Table)
+
+
+def get_array(cells, dtype):
+    """Build an Arrow array straight from a column of cells, according to the
+    column data type."""
+    arrow_type = get_arrow_type(dtype)
+
+    if dtype in parsers.number_types:
+        return pa.array([cell["value"] for cell in cells], type=arrow_type)
+
+    elif dtype == "currency":
+        values = [cell["value"] for cell in cells]
+        return pa.array(
+            [value["amount"] if isinstance(value, dict) else value for value in values],
+            type=arrow_type,
+        )
+
+    elif dtype in parsers.date_types:
+        values = [cell["value"] for cell in cells]
+        try:
+            return pa.array(values, type=pa.string()).cast(arrow_type)
+        except pa.ArrowInvalid:
+            timestamps = pd.to_datetime(values, utc=True)
+            if arrow_type.tz is None:
+                timestamps = timestamps.tz_localize(None)
+            return pa.array(timestamps, type=arrow_type, from_pandas=True)
+
+    return pa.array([cell["label"] for cell in cells], type=arrow_type)
+
+
+def concat(pages):
+    """Concatenate Arrow tables, without copying their data."""
+    require_pyarrow()
+    return pa.concat_tables(pages)
+
+
+def from_pandas(df, schema):
+    """Convert a DataFrame into an Arrow table with the given schema.
+
+    Values of string columns which pandas did not read as strings, such as
+    empty columns read as floats, are turned into strings, keeping nulls.
+    """
+    require_pyarrow()
+
+    arrays = []
+    for field in schema:
+        values = df[field.name]
+        if pa.types.is_string(field.type) and values.dtype != object:
+            values = values.astype(str).where(values.notna(), None)
+        arrays.append(pa.array(values, type=field.type, from_pandas=True))
+
+    return pa.Table.from_arrays(arrays, schema=schema)
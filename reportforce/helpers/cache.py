@@ -0,0 +1,288 @@
+import os
+import json
+import time
+import uuid
+import sqlite3
+import hashlib
+import contextlib
+import pandas as pd
+
+from reportforce.helpers import decoder
+
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "reportforce")
+
+
+class MetadataCache:
+    """On-disk cache of reports metadata, stored in a SQLite database that can
+    be shared by several processes.
+
+    Entries are keyed by instance URL, API version and report ID.
+
+    Attributes
+    ----------
+    path : str
+        Path to the SQLite database.
+
+    ttl : int, float, default 86400
+        Seconds after which an entry expires.
+
+    max_entries : int, default 1000
+        Maximum number of entries. The least recently used ones are evicted
+        when it is exceeded.
+
+    hits, misses : int
+        Number of hits and misses in this process.
+
+    Examples
+    --------
+    >>> cache = MetadataCache(ttl=3600)
+    >>> rf = Reportforce("user", "pass", "token", metadata_cache=cache)
+    """
+
+    def __init__(
+        self,
+        path=os.path.join(DEFAULT_CACHE_DIR, "metadata.sqlite"),
+        ttl=86400,
+        max_entries=1000,
+        timeout=30,
+    ):
+        self.path = path
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.timeout = timeout
+
+        self.hits = 0
+        self.misses = 0
+
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+
+        with self._connect() as connection:
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute(
+                """CREATE TABLE IF NOT EXISTS metadata (
+                    instance_url TEXT,
+                    version TEXT,
+                    report_id TEXT,
+                    value BLOB,
+                    created_at REAL,
+                    accessed_at REAL,
+                    PRIMARY KEY (instance_url, version, report_id)
+                )"""
+            )
+
+    @contextlib.contextmanager
+    def _connect(self):
+        connection = sqlite3.connect(self.path, timeout=self.timeout)
+        try:
+            with connection:
+                yield connection
+        finally:
+            connection.close()
+
+    def get(self, instance_url, version, report_id):
+        """Get a report metadata, or None if it is missing or expired."""
+        key = (instance_url, version, report_id)
+        now = time.time()
+
+        with self._connect() as connection:
+            row = connection.execute(
+                """SELECT value, created_at FROM metadata
+                WHERE instance_url = ? AND version = ? AND report_id = ?""",
+                key,
+            ).fetchone()
+
+            if row is None or now - row[1] > self.ttl:
+                self.misses += 1
+                return None
+
+            connection.execute(
+                """UPDATE metadata SET accessed_at = ?
+                WHERE instance_url = ? AND version = ? AND report_id = ?""",
+                (now,) + key,
+            )
+
+        self.hits += 1
+        return decoder.loads(row[0])
+
+    def set(self, instance_url, version, report_id, metadata):
+        """Store a report metadata, evicting the least recently used entries
+        if there are more than max_entries."""
+        now = time.time()
+        value = json.dumps(metadata).encode()
+
+        with self._connect() as connection:
+            connection.execute(
+                "INSERT OR REPLACE INTO metadata VALUES (?, ?, ?, ?, ?, ?)",
+                (instance_url, version, report_id, value, now, now),
+            )
+            connection.execute(
+                """DELETE FROM metadata WHERE rowid NOT IN (
+                    SELECT rowid FROM metadata
+                    ORDER BY accessed_at DESC LIMIT ?
+                )""",
+                (self.max_entries,),
+            )
+
+    def invalidate(self, instance_url=None, version=None, report_id=None):
+        """Remove the entries matching every given argument, or all of them if
+        none is given."""
+        conditions = {
+            "instance_url": instance_url,
+            "version": version,
+            "report_id": report_id,
+        }
+        conditions = {k: v for k, v in conditions.items() if v is not None}
+
+        where = " AND ".join("{} = ?".format(column) for column in conditions)
+        query = "DELETE FROM metadata" + (" WHERE " + where if where else "")
+
+        with self._connect() as connection:
+            connection.execute(query, tuple(conditions.values()))
+
+    def __len__(self):
+        with self._connect() as connection:
+            return connection.execute("SELECT COUNT(*) FROM metadata").fetchone()[0]
+
+    @property
+    def stats(self):
+        return {"hits": self.hits, "misses": self.misses, "entries": len(self)}
+
+
+class ReportCache:
+    """On-disk cache of reports DataFrames, stored as Parquet files. It needs
+    pyarrow or fastparquet to be installed.
+
+    Entries are keyed by a hash of the report metadata after filters, dates
+    and logic were applied, along with the other options that change the
+    resulting DataFrame.
+
+    Attributes
+    ----------
+    directory : str
+        Directory where Parquet files are stored.
+
+    ttl : int, float, default 3600
+        Seconds after which an entry expires.
+
+    max_size : int, default 1 GiB
+        Maximum total size of the stored files, in bytes. The least recently
+        used ones are evicted when it is exceeded.
+
+    hits, misses : int
+        Number of hits and misses in this process.
+
+    Examples
+    --------
+    >>> cache = ReportCache(ttl=600)
+    >>> rf = Reportforce("user", "pass", "token", report_cache=cache)
+    """
+
+    suffix = ".parquet"
+
+    def __init__(
+        self,
+        directory=os.path.join(DEFAULT_CACHE_DIR, "reports"),
+        ttl=3600,
+        max_size=1024 ** 3,
+    ):
+        self.directory = directory
+        self.ttl = ttl
+        self.max_size = max_size
+
+        self.hits = 0
+        self.misses = 0
+
+        os.makedirs(directory, exist_ok=True)
+
+    @staticmethod
+    def get_key(*parts):
+        serialized = json.dumps(parts, sort_keys=True, default=str)
+        return hashlib.sha256(serialized.encode()).hexdigest()
+
+    def _get_path(self, key):
+        return os.path.join(self.directory, key + self.suffix)
+
+    def get(self, key):
+        """Get a report DataFrame, or None if it is missing or expired."""
+        path = self._get_path(key)
+        now = time.time()
+
+        try:
+            modified_at = os.stat(path).st_mtime
+            if now - modified_at > self.ttl:
+                os.remove(path)
+                raise FileNotFoundError(path)
+
+            df = pd.read_parquet(path)
+
+            # the access time is used to evict the least recently used entries
+            os.utime(path, (now, modified_at))
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return df
+
+    def set(self, key, df):
+        """Store a report DataFrame, evicting the least recently used entries
+        if the total size exceeds max_size.
+
+        DataFrames which can't be stored faithfully as Parquet, because their
+        column or index names are not unique, are not stored.
+        """
+        names = list(df.columns) + list(df.index.names)
+        if len(set(names)) < len(names):
+            return
+
+        path = self._get_path(key)
+        temporary_path = "{}.{}.tmp".format(path, uuid.uuid4().hex)
+
+        df.to_parquet(temporary_path)
+        os.replace(temporary_path, path)
+
+        self.evict()
+
+    def _list_entries(self):
+        entries = []
+
+        for name in os.listdir(self.directory):
+            if name.endswith(self.suffix):
+                path = os.path.join(self.directory, name)
+                try:
+                    entries.append((path, os.stat(path)))
+                except FileNotFoundError:
+                    pass
+
+        return entries
+
+    def evict(self):
+        entries = sorted(self._list_entries(), key=lambda entry: entry[1].st_atime)
+        total_size = sum(stat.st_size for _, stat in entries)
+
+        for path, stat in entries:
+            if total_size <= self.max_size:
+                break
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(path)
+            total_size -= stat.st_size
+
+    def invalidate(self, key=None):
+        """Remove an entry, or all of them if no key is given."""
+        paths = [self._get_path(key)] if key else [p for p, _ in self._list_entries()]
+
+        for path in paths:
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(path)
+
+    def __len__(self):
+        return len(self._list_entries())
+
+    @property
+    def size(self):
+        return sum(stat.st_size for _, stat in self._list_entries())
+
+    @property
+    def stats(self):
+        return {"hits": self.hits, "misses": self.misses, "entries": len(self)}
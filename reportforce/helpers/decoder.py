@@ -0,0 +1,50 @@
+"""Decode Analytics API response bodies from raw bytes.
+
+The fastest available backend is used by default: orjson, if it is installed,
+or else the standard library json module. Other backends can be registered
+with `register_backend` and chosen with `use_backend`.
+"""
+import json
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+backends = {"json": json.loads}
+
+if orjson is not None:
+    backends["orjson"] = orjson.loads
+
+default_backend = "orjson" if "orjson" in backends else "json"
+current_backend = default_backend
+
+
+def register_backend(name, loads):
+    """Register a function which decodes JSON from bytes as a backend."""
+    backends[name] = loads
+
+
+def use_backend(name):
+    """Choose which backend is used to decode response bodies."""
+    global current_backend
+
+    if name not in backends:
+        raise ValueError(
+            "Unknown JSON backend {!r}, choose one of {}".format(name, list(backends))
+        )
+
+    current_backend = name
+
+
+def loads(content):
+    return backends[current_backend](content)
+
+
+def decode(response):
+    """Decode a response JSON body only once, caching it on the response."""
+    try:
+        return response._decoded_json
+    except AttributeError:
+        response._decoded_json = loads(response.content)
+        return response._decoded_json
@@ -0,0 +1,110 @@
+import pandas as pd
+
+from reportforce.helpers import arrow, parsers
+
+category_types = ["string", "picklist", "multipicklist", "combobox"]
+# often unique, so a categorical would take more memory than the strings
+id_types = ["id", "reference"]
+boolean_labels = {"true": True, "false": False}
+
+dtypes_options = [None, "compact"]
+
+
+def check_dtypes(dtypes):
+    if dtypes not in dtypes_options:
+        raise ValueError(
+            "dtypes must be one of {}, got {!r}".format(dtypes_options, dtypes)
+        )
+
+
+def convert_dtypes(df, metadata, dtypes):
+    if dtypes == "compact":
+        return compact_dtypes(df, metadata)
+    return df
+
+
+def to_category(series):
+    if series.dtype != object:
+        return series
+    return series.astype("category")
+
+
+def to_string(series):
+    """Store strings in a single Arrow buffer, if pyarrow is installed."""
+    if series.dtype != object or arrow.pa is None:
+        return series
+    return series.astype("string[pyarrow]")
+
+
+def to_category_if_repeated(series):
+    """Convert into a categorical only if most values are repeated, as in a
+    lookup, and into strings otherwise."""
+    if series.dtype == object and series.nunique() <= len(series) // 2:
+        return series.astype("category")
+    return to_string(series)
+
+
+def to_nullable_int(series):
+    return series.astype("Int64")
+
+
+def to_boolean(series):
+    if series.dtype == bool:
+        return series.astype("boolean")
+    labels = series.astype(str).str.lower()
+    return labels.map(boolean_labels).astype("boolean")
+
+
+def to_datetime(series):
+    if pd.api.types.is_datetime64_any_dtype(series):
+        return series
+    return pd.to_datetime(series, errors="coerce")
+
+
+def get_converter(dtype):
+    if dtype in category_types:
+        return to_category
+    elif dtype in id_types:
+        return to_category_if_repeated
+    elif dtype == "int":
+        return to_nullable_int
+    elif dtype == "boolean":
+        return to_boolean
+    elif dtype in parsers.date_types:
+        return to_datetime
+
+
+def get_labels_dtypes(metadata):
+    """Map every detail and aggregate column label to its data type."""
+    return {
+        info["label"]: info["dataType"]
+        for _, info in list(metadata.aggregate_column_info)
+        + list(metadata.detail_column_info)
+    }
+
+
+def compact_dtypes(df, metadata):
+    """Convert a report DataFrame columns into memory-efficient dtypes
+    according to their data type in the report metadata.
+
+    Strings and picklists become categoricals, IDs and lookups become
+    categoricals only if most of their values repeat and Arrow strings
+    otherwise, integers become nullable integers, booleans become nullable booleans and dates become datetime64.
+    For matrix reports, the data type of a column is the one of the aggregate
+    in its first level.
+    """
+    labels_dtypes = get_labels_dtypes(metadata)
+
+    columns = {}
+    for position, label in enumerate(df.columns):
+        column = df.iloc[:, position]
+
+        aggregate_or_label = label[0] if isinstance(label, tuple) else label
+        convert = get_converter(labels_dtypes.get(aggregate_or_label))
+
+        columns[position] = convert(column) if convert else column
+
+    compact_df = pd.DataFrame(columns, index=df.index)
+    compact_df.columns = df.columns
+
+    return compact_df
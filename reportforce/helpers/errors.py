@@ -1,11 +1,24 @@
+from reportforce.helpers import decoder
+
+
 def handle_error(response, **kwargs):
+    if not is_json_error(response):
+        return
+
     try:
-        error = response.json()[0]
+        error = decoder.decode(response)[0]
         raise ReportError(error["errorCode"], error["message"])
-    except (KeyError, ValueError):
+    except (KeyError, IndexError, ValueError):
         pass
 
 
+def is_json_error(response):
+    """Check the status code and content type before reading the body, so that
+    successful responses are not decoded here."""
+    content_type = response.headers.get("Content-Type", "")
+    return response.status_code >= 400 and "json" in content_type
+
+
 class ReportError(Exception):
     """Class to represent any Analytics API error."""
 
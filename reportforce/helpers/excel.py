@@ -0,0 +1,97 @@
+import pandas as pd
+
+try:
+    import openpyxl
+except ImportError:  # pragma: no cover
+    openpyxl = None
+
+from reportforce.helpers import parsers
+
+
+def require_openpyxl():
+    if openpyxl is None:
+        raise ImportError(
+            "openpyxl is needed to read spreadsheets, install it with "
+            "`pip install reportforce[excel]`"
+        )
+
+
+def get_fields(metadata):
+    """Get the label and data type of every detail column of a tabular report,
+    from its metadata."""
+    if metadata.report_format != "TABULAR":
+        raise ValueError("Only tabular reports can be read from a spreadsheet")
+
+    return [
+        (metadata.get_column_label(column), metadata.get_column_dtype(column))
+        for column in metadata.detail_columns
+    ]
+
+
+def find_header(rows, labels):
+    """Consume rows until the one with every column label, returning the
+    position of each label in it."""
+    for row in rows:
+        if set(labels).issubset(row):
+            return [row.index(label) for label in labels]
+
+    raise ValueError("Could not find the columns {} in the spreadsheet".format(labels))
+
+
+def convert(values, dtype):
+    """Convert a column read from a spreadsheet according to its data type."""
+    if dtype in parsers.number_types or dtype == "currency":
+        return pd.to_numeric(values, errors="coerce")
+
+    elif dtype in parsers.date_types:
+        return pd.to_datetime(values, errors="coerce")
+
+    return pd.Series(values, dtype=object).map(str, na_action="ignore")
+
+
+def read_excel(spreadsheet, metadata):
+    """Read a report spreadsheet, as exported by the Analytics API, into a
+    DataFrame.
+
+    The workbook is read in read-only mode, row by row. Rows before the one
+    with the column labels are skipped, and so is everything from the first
+    empty row onwards, such as the grand total and the footer.
+
+    Parameters
+    ----------
+    spreadsheet : file object
+        A binary file object with the XLSX content, e.g. io.BytesIO.
+
+    metadata : Metadata
+        Metadata of the report, giving its columns labels and data types.
+
+    Returns
+    -------
+    DataFrame
+        A DataFrame with a column for each detail column of the report.
+    """
+    require_openpyxl()
+
+    labels, dtypes = zip(*get_fields(metadata))
+
+    workbook = openpyxl.load_workbook(spreadsheet, read_only=True, data_only=True)
+    try:
+        rows = workbook.active.iter_rows(values_only=True)
+        positions = find_header(rows, labels)
+
+        records = []
+        for row in rows:
+            record = [row[i] if i < len(row) else None for i in positions]
+            if all(value is None for value in record):
+                break
+            records.append(record)
+    finally:
+        workbook.close()
+
+    columns = zip(*records) if records else [()] * len(labels)
+    columns = [convert(list(values), dtype) for values, dtype in zip(columns, dtypes)]
+
+    df = pd.DataFrame(dict(enumerate(columns)))
+    df.columns = labels
+
+    return df
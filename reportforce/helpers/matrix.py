@@ -1,66 +1,125 @@
-import re
 import numpy as np
 import pandas as pd
 
-from distutils.version import LooseVersion
-
-from reportforce.helpers import parsers
+from reportforce.helpers import arrow, parsers
 from reportforce.helpers.report import Report
 
 
 class Matrix(Report):
     def to_dataframe(self):
-        cells = np.array(self.get_cells())
+        aggregates = self.get_cells()
 
-        if cells.size == 0:
+        if not aggregates or len(aggregates[0]) == 0:
             return pd.DataFrame()
 
-        columns = self.get_matrix_columns()
         index = self.get_index()
+        n_across = len(aggregates[0]) // len(index)
+
+        # cells are ordered by group down and then across, so every n_across-th
+        # cell belongs to the same group across, and the columns are ordered
+        # by group across and then by aggregate
+        columns = [
+            values[i::n_across] for i in range(n_across) for values in aggregates
+        ]
+
+        df = pd.DataFrame(dict(enumerate(columns)))
+        df.index = index
+        df.columns = self.get_matrix_columns()
+
+        return df
+
+    def to_arrow(self):
+        """Get the report as an Arrow table built straight from the factMap,
+        with a string column for each grouping down and a column for each
+        aggregate and group across, named after their labels joined by
+        slashes."""
+        factmap = self["factMap"]
 
-        cells.shape = (len(index), len(columns))
-
-        return pd.DataFrame(cells, columns=columns, index=index)
+        n_down = len(self.report_metadata["groupingsDown"])
+        n_across = len(self.report_metadata["groupingsAcross"])
+        keys = parsers.parse_factmap_keys(factmap, n_down, n_across)
+
+        down_levels, down_codes = parsers.get_groups_levels(
+            self["groupingsDown"]["groupings"], n_down
+        )
+        across_levels, across_codes = parsers.get_groups_levels(
+            self["groupingsAcross"]["groupings"], n_across
+        )
+
+        n_rows = len(down_codes[0]) if keys and down_codes else 0
+        n_groups = len(across_codes[0]) if n_rows and across_codes else 0
+
+        arrays = [
+            arrow.pa.array(
+                np.array(labels, dtype=object)[level_codes[:n_rows]],
+                type=arrow.pa.string(),
+            )
+            for labels, level_codes in zip(down_levels, down_codes)
+        ]
+        fields = [(label, "string") for label in self.get_groupings_down_labels()]
+
+        aggregates = [
+            (info["label"], info["dataType"]) for info in self.get_aggregates_info()
+        ]
+
+        # cells are ordered by group down and then across, so every
+        # n_groups-th cell belongs to the same group across
+        for i in range(n_groups):
+            across = [
+                str(labels[level_codes[i]])
+                for labels, level_codes in zip(across_levels, across_codes)
+            ]
+            group_keys = keys[i::n_groups]
+
+            for j, (label, dtype) in enumerate(aggregates):
+                cells = [factmap[key]["aggregates"][j] for key, _, _ in group_keys]
+                arrays.append(arrow.get_array(cells, dtype))
+                fields.append((" / ".join([label] + across), dtype))
+
+        return arrow.pa.Table.from_arrays(arrays, schema=arrow.get_schema(fields))
 
     def get_cells(self):
+        """Get the cells of every aggregate, one typed array each, in the
+        order of the factMap aggregates, ordered by group down and then by
+        group across."""
         factmap = self["factMap"]
 
         n_rows = len(self.report_metadata["groupingsDown"])
         n_cols = len(self.report_metadata["groupingsAcross"])
 
-        # patterns to filter out sub/grandtotals
-        row_pattern = r"_".join(["[0-9]+"] * n_rows)
-        col_pattern = r"_".join(["[0-9]+"] * n_cols)
-        pattern = f"{row_pattern}!{col_pattern}"
-
-        groups = [group for group in factmap if re.search(pattern, group)]
-        dtypes = self.get_columns_dtypes()
-
-        cells = []
-        for group in sorted(groups, key=LooseVersion):
-            aggregates = factmap[group]["aggregates"]
-            for agg, dtype in zip(aggregates, dtypes):
-                value = parsers.get_value(agg, dtype)
-                cells.append(value)
+        keys = parsers.parse_factmap_keys(factmap, n_rows, n_cols)
+        dtypes = [info["dataType"] for info in self.get_aggregates_info()]
 
-        return cells
+        return parsers.get_aggregates(factmap, keys, dtypes)
 
     def get_index(self):
-        groupings = self["groupingsDown"]["groupings"]
+        levels, codes = parsers.get_groups_levels(
+            self["groupingsDown"]["groupings"],
+            len(self.report_metadata["groupingsDown"]),
+        )
         names = self.get_groupings_down_labels()
-        return pd.MultiIndex.from_tuples(parsers.get_groups(groupings), names=names)
 
-    def get_matrix_columns(self):
-        groupings_across = self["groupingsAcross"]["groupings"]
-        groups = parsers.get_groups(groupings_across)
-
-        aggregates = self.get_columns_labels()
+        return pd.MultiIndex(levels=levels, codes=codes, names=names)
 
-        groups_and_aggs = []
-        for group in groups:
-            for agg in aggregates:
-                groups_and_aggs.append((agg,) + group)
-
-        if groups_and_aggs:
-            groups_labels = ["Aggregates"] + self.get_groupings_across_labels()
-            return pd.MultiIndex.from_tuples(groups_and_aggs, names=groups_labels)
+    def get_matrix_columns(self):
+        """Get a column for each group across and aggregate, grouped across
+        first, with the aggregates as the outermost level."""
+        levels, codes = parsers.get_groups_levels(
+            self["groupingsAcross"]["groupings"],
+            len(self.report_metadata["groupingsAcross"]),
+        )
+
+        aggregates = [info["label"] for info in self.get_aggregates_info()]
+        aggregates_levels, aggregates_codes = parsers.get_groups_levels(
+            [{"label": label, "groupings": []} for label in aggregates], 1
+        )
+
+        n_groups = len(codes[0]) if codes else 0
+        if n_groups and aggregates:
+            levels = aggregates_levels + levels
+            codes = [np.tile(aggregates_codes[0], n_groups)] + [
+                np.repeat(level_codes, len(aggregates)) for level_codes in codes
+            ]
+
+            names = ["Aggregates"] + self.get_groupings_across_labels()
+            return pd.MultiIndex(levels=levels, codes=codes, names=names)
@@ -1,11 +1,45 @@
 import re
+import copy
+import datetime
 import itertools
 
-from dateutil.parser import parse
+from dateutil.parser import parse, isoparse
 from reportforce.helpers import utils
 
 
 class Metadata(dict):
+    # report metadata fields which are changed before running a report
+    overlay_fields = [
+        "reportFilters",
+        "reportBooleanFilter",
+        "standardDateFilter",
+        "sortBy",
+        "detailColumns",
+        "groupingsDown",
+        "groupingsAcross",
+        "aggregates",
+    ]
+
+    def overlay(self):
+        """Copy the metadata to change it before running a report, sharing
+        everything with this one, which is left untouched, but the report
+        metadata fields that may change. This is much cheaper than a deep copy
+        of the whole describe document, which holds every column of the
+        report type.
+
+        The columns index is shared too, so it is only built once.
+        """
+        report_metadata = dict(self.report_metadata)
+        for field in self.overlay_fields:
+            if field in report_metadata:
+                report_metadata[field] = copy.deepcopy(report_metadata[field])
+
+        overlay = Metadata(self)
+        overlay["reportMetadata"] = report_metadata
+        overlay._columns_index = self.columns_index
+
+        return overlay
+
     @property
     def report_metadata(self):
         return self["reportMetadata"]
@@ -14,6 +48,12 @@ class Metadata(dict):
     def extended_metadata(self):
         return self["reportExtendedMetadata"]
 
+    @property
+    def payload(self):
+        """Body of a request to run the report, which only needs the report
+        metadata, not the whole describe document."""
+        return {"reportMetadata": self.report_metadata}
+
     @property
     def report_format(self):
         return self.report_metadata["reportFormat"]
@@ -50,6 +90,8 @@ class Metadata(dict):
 
     @staticmethod
     def format_date(value):
+        if isinstance(value, datetime.date):
+            return value.isoformat()
         if value is not None:
             return parse(value, dayfirst=True).isoformat()
 
@@ -125,6 +167,19 @@ class Metadata(dict):
     def date_interval(self, interval):
         self.date_filter["durationValue"] = interval
 
+    @property
+    def date_range(self):
+        """Standard date filter start and end as datetime.date objects."""
+        start, end = self.date_start, self.date_end
+        if start is None or end is None:
+            raise ValueError("The standard date filter needs a start and an end date")
+        return isoparse(start).date(), isoparse(end).date()
+
+    def set_date_window(self, start, end):
+        self.date_interval = "CUSTOM"
+        self.date_start = start
+        self.date_end = end
+
     def ignore_date_filter(self):
         self.date_interval = "CUSTOM"
         self.date_start = None
@@ -137,6 +192,85 @@ class Metadata(dict):
         self.date_start = start
         self.date_end = end
 
+    @property
+    def detail_columns(self):
+        return self.report_metadata["detailColumns"]
+
+    @detail_columns.setter
+    def detail_columns(self, labels):
+        api_names = []
+
+        for label in labels:
+            api_name = self.get_column_api_name(label)
+            if api_name is None:
+                raise ValueError("Unknown column {!r}".format(label))
+            api_names.append(api_name)
+
+        self.report_metadata["detailColumns"] = api_names
+
+    aggregate_functions = {
+        "sum": "s",
+        "mean": "a",
+        "min": "m",
+        "max": "mx",
+        "unique": "u",
+    }
+
+    def get_grouping(self, grouping):
+        """Get a grouping given a column label, or a tuple of a column label
+        and a date granularity, e.g. ("Close Date", "Month")."""
+        column, granularity = (
+            (grouping, "None") if isinstance(grouping, str) else grouping
+        )
+
+        api_name = self.get_column_api_name(column)
+        if api_name is None:
+            raise ValueError("Unknown column {!r}".format(column))
+
+        return {
+            "name": api_name,
+            "sortOrder": "Asc",
+            "dateGranularity": granularity,
+            "sortAggregate": None,
+        }
+
+    def get_aggregate(self, aggregate):
+        """Get an aggregate API name given "count", a tuple of a function and a
+        column label, e.g. ("sum", "Amount"), or an API name as is, e.g.
+        "s!AMOUNT"."""
+        if aggregate == "count":
+            return "RowCount"
+
+        if isinstance(aggregate, str):
+            return aggregate
+
+        function, column = aggregate
+
+        if function not in self.aggregate_functions:
+            raise ValueError(
+                "Aggregate function must be one of {}, got {!r}".format(
+                    list(self.aggregate_functions), function
+                )
+            )
+
+        api_name = self.get_column_api_name(column)
+        if api_name is None:
+            raise ValueError("Unknown column {!r}".format(column))
+
+        return "{}!{}".format(self.aggregate_functions[function], api_name)
+
+    def group_by(self, down, across=None, aggregates=("count",)):
+        """Make the report aggregate its rows by groupings down and, if any,
+        across, without detail rows. It becomes a summary report, or a matrix
+        one if there are groupings across."""
+        self.report_metadata["groupingsDown"] = list(map(self.get_grouping, down))
+        self.report_metadata["groupingsAcross"] = list(
+            map(self.get_grouping, across or [])
+        )
+        self.report_metadata["aggregates"] = list(map(self.get_aggregate, aggregates))
+        self.report_metadata["reportFormat"] = "MATRIX" if across else "SUMMARY"
+        self.report_metadata["hasDetailRows"] = False
+
     @property
     def detail_column_info(self):
         return self.extended_metadata["detailColumnInfo"].items()
@@ -162,15 +296,34 @@ class Metadata(dict):
             self.all_available_columns,
         )
 
+    @property
+    def columns_index(self):
+        """Columns info indexed by API name and by label, built only once. If a
+        column appears more than once, the first one in all_columns_info wins."""
+        try:
+            return self._columns_index
+        except AttributeError:
+            by_api_name, by_label = {}, {}
+
+            for api_name, infos in self.all_columns_info:
+                by_api_name.setdefault(api_name, infos)
+                by_label.setdefault(infos["label"], (api_name, infos))
+
+            self._columns_index = by_api_name, by_label
+            return self._columns_index
+
     def get_column_info_by_api_name(self, target, info):
-        for api_name, infos in self.all_columns_info:
-            if api_name == target:
-                return infos.get(info)
+        by_api_name, _ = self.columns_index
+
+        if target in by_api_name:
+            return by_api_name[target].get(info)
 
     def get_column_info_by_label(self, target, info):
-        for api_name, infos in self.all_columns_info:
-            if infos["label"] == target:
-                return api_name if info == "apiName" else infos.get(info)
+        _, by_label = self.columns_index
+
+        if target in by_label:
+            api_name, infos = by_label[target]
+            return api_name if info == "apiName" else infos.get(info)
 
     def get_column_label(self, column):
         return self.get_column_info_by_api_name(column, "label")
@@ -214,24 +367,3 @@ class Metadata(dict):
                 "sortOrder": order.title(),
             }
         ]
-
-    def _get_strategy(self, id_column):
-        is_lookup = self._is_lookup(id_column)
-        if is_lookup:
-            self.sort_by = (id_column, "Asc")
-            self.report_filters = [(id_column, ">", "")]
-            self.increment_boolean_filter()
-            return self._filter_by_sorting
-        return self._filter_past_values
-
-    def _is_lookup(self, column):
-        return self.get_column_info_by_label(column, "isLookup")
-
-    def _filter_past_values(self, df, id_column):
-        new_filter = (id_column, "!=", df[id_column])
-        self.report_filters = [new_filter]
-        self.increment_boolean_filter()
-
-    def _filter_by_sorting(self, df, id_column):
-        last_value = df[id_column].iat[-1]
-        self.report_filters[-1]["value"] = utils.surround_with_quotes(last_value)
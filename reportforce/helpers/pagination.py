@@ -0,0 +1,186 @@
+import collections
+import numpy as np
+import pandas as pd
+
+from reportforce.helpers import arrow
+
+
+class KeysetPaginator:
+    """Paginate a report past the Analytics API's row limit by sorting it by a
+    column and requesting, on each page, only rows greater than or equal to
+    the last value seen.
+
+    Rows sharing the last value of a page come back in the next one, so the
+    keys of those rows are counted and dropped from it as many times as they
+    were seen, which keeps identical rows apart. Only the rows at a page
+    boundary are counted, so every request costs about the same no matter how
+    deep the pagination goes.
+
+    Pages may be either DataFrames or Arrow tables.
+
+    Attributes
+    ----------
+    metadata : Metadata
+        Report metadata to be updated before every request.
+
+    column : str
+        Label of the sortable column to paginate on.
+    """
+
+    def __init__(self, metadata, column):
+        self.metadata = metadata
+        self.column = column
+
+        self.api_name = metadata.get_column_api_name(column)
+        self.filter_index = None
+        self.last_value = None
+        self.seen = collections.Counter()
+
+        metadata.sort_by = (column, "Asc")
+
+    @staticmethod
+    def get_keys(df):
+        return pd.util.hash_pandas_object(df, index=False)
+
+    def get_column(self, page):
+        if arrow.is_table(page):
+            return page.column(self.column).to_pandas()
+        return page[self.column]
+
+    def get_boundary_keys(self, page, positions):
+        """Get the keys of the rows at the given positions of a page."""
+        if arrow.is_table(page):
+            return self.get_keys(page.take(positions).to_pandas())
+        return self.get_keys(page.iloc[positions])
+
+    def drop_seen(self, page):
+        """Drop rows already returned by the previous page."""
+        if not self.seen or len(page) == 0:
+            return page
+
+        at_boundary = np.flatnonzero(self.get_column(page) == self.last_value)
+        keys = self.get_boundary_keys(page, at_boundary)
+
+        remaining = self.seen.copy()
+        keep = np.ones(len(page), dtype=bool)
+
+        for position, key in zip(at_boundary, keys):
+            if remaining[key] > 0:
+                remaining[key] -= 1
+                keep[position] = False
+
+        if arrow.is_table(page):
+            return page.filter(keep)
+        return page[keep]
+
+    def update(self, page):
+        """Update the filter to request rows after the given page."""
+        if len(page) == 0:
+            raise ValueError(
+                "Too many rows share the value {!r} in column {!r} to "
+                "paginate on it, choose a column with more distinct "
+                "values.".format(self.last_value, self.column)
+            )
+
+        column = self.get_column(page)
+        last_value = column.iat[-1]
+
+        if pd.isna(last_value):
+            raise ValueError(
+                "The last row of a page has no value in column {!r} to "
+                "paginate on it, choose a column without empty "
+                "values.".format(self.column)
+            )
+
+        at_boundary = np.flatnonzero(column == last_value)
+        keys = collections.Counter(self.get_boundary_keys(page, at_boundary))
+
+        if last_value == self.last_value:
+            self.seen.update(keys)
+        else:
+            self.seen = keys
+
+        self.last_value = last_value
+        self.set_filter(last_value)
+
+    def set_filter(self, value):
+        if self.filter_index is None:
+            self.filter_index = len(self.metadata.report_filters)
+            self.metadata.report_filters = [(self.column, ">=", value)]
+            self.metadata.increment_boolean_filter()
+        else:
+            report_filter = self.metadata.report_filters[self.filter_index]
+            report_filter["value"] = self.metadata.format_value(value, self.api_name)
+
+
+class PastValuesPaginator:
+    """Paginate a report past the Analytics API's row limit by requesting, on
+    each page, only rows whose column value is not equal to any value seen so
+    far.
+
+    Summary and matrix reports are sorted within each grouping only, so they
+    cannot be paginated with a keyset. The filter grows with every page, so
+    the column must have a unique value for each row and must not be a
+    lookup, which Salesforce does not filter by value.
+
+    Attributes
+    ----------
+    metadata : Metadata
+        Report metadata to be updated before every request.
+
+    column : str
+        Label of the column to paginate on.
+    """
+
+    def __init__(self, metadata, column):
+        if metadata.get_column_info_by_label(column, "isLookup"):
+            raise ValueError(
+                "Lookup column {!r} cannot be used to paginate a {} report, "
+                "choose another column.".format(column, metadata.report_format)
+            )
+
+        self.metadata = metadata
+        self.column = column
+
+        self.api_name = metadata.get_column_api_name(column)
+        self.filter_index = None
+        self.values = {}
+
+    def get_column(self, page):
+        if arrow.is_table(page):
+            return page.column(self.column).to_pandas()
+        return page[self.column]
+
+    def drop_seen(self, page):
+        """Rows seen before are filtered out by Salesforce already."""
+        return page
+
+    def update(self, page):
+        """Update the filter to request rows not in any previous page."""
+        n_values = len(self.values)
+        self.values.update(dict.fromkeys(self.get_column(page)))
+
+        if len(self.values) == n_values:
+            raise ValueError(
+                "No new values in column {!r} to paginate on it, choose a "
+                "column with a unique value for each row.".format(self.column)
+            )
+
+        self.set_filter(list(self.values))
+
+    def set_filter(self, values):
+        if self.filter_index is None:
+            self.filter_index = len(self.metadata.report_filters)
+            self.metadata.report_filters = [(self.column, "!=", values)]
+            self.metadata.increment_boolean_filter()
+        else:
+            report_filter = self.metadata.report_filters[self.filter_index]
+            report_filter["value"] = self.metadata.format_value(values, self.api_name)
+
+
+def get_paginator(metadata, column):
+    """Get a keyset paginator for tabular reports, which are sorted as a
+    whole, or a past values paginator for summary and matrix reports."""
+    if metadata.report_format == "TABULAR":
+        return KeysetPaginator(metadata, column)
+    return PastValuesPaginator(metadata, column)
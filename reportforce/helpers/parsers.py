@@ -1,4 +1,4 @@
-import itertools
+import numpy as np
 import pandas as pd
 
 number_types = ["double", "percent", "int"]
@@ -22,79 +22,116 @@ def get_value(cell, dtype):
     return cell["label"]
 
 
-def get_groups(groups):
-    """Iterate through a list of groupings to
-    get the cartesian product of their values.
-
-    For example, given this list of groupings:
-
-    g = [
-        {
-            "groupings": [
-                {
-                    "groupings": [
-                        {
-                            "groupings": [
-                                {
-                                    "groupings": [],
-                                    "label": "grouping4_1"
-                                }
-                                ],
-                            "label": "grouping3_1",
-                        },
-                        {
-                            "groupings": [
-                                {
-                                    "groupings": [],
-                                    "label": "grouping4_1"
-                                }
-                                ],
-                            "label": "grouping3_2",
-                        },
-                    ],
-                    "label": "grouping2",
-                }
-            ],
-            "label": "grouping1",
-        }
-    ]
-
-    Our job is to extract the label of each group and put them
-    in a list per level of nesting.
+def get_values(cells, dtype):
+    """Get the values of a whole column of cells according to its data type,
+    converting them all at once."""
+    if dtype in number_types:
+        return pd.to_numeric([cell["value"] for cell in cells])
+
+    elif dtype in date_types:
+        values = [cell["value"] for cell in cells]
+        try:
+            return pd.to_datetime(values)
+        except (TypeError, ValueError):
+            return [pd.Timestamp(value) for value in values]
+
+    elif dtype == "currency":
+        values = [cell["value"] for cell in cells]
+        return pd.to_numeric(
+            [value["amount"] if isinstance(value, dict) else value for value in values]
+        )
+
+    return [cell["label"] for cell in cells]
+
+
+def parse_grouping_key(key):
+    """Parse the part of a factMap key about either groupings down or across
+    into a tuple of group indices, or None if it is a grand total, "T".
 
     Examples
     --------
-    >>> get_groups(g)
-    [('grouping1', 'grouping2', 'grouping3_1', 'grouping4_1'),
-     ('grouping1', 'grouping2', 'grouping3_1', 'grouping4_1'),
-     ('grouping1', 'grouping2', 'grouping3_2', 'grouping4_1'),
-     ('grouping1', 'grouping2', 'grouping3_2', 'grouping4_1')]
+    >>> parse_grouping_key("10_2")
+    (10, 2)
+    """
+    if key == "T":
+        return None
+    return tuple(int(index) for index in key.split("_"))
+
+
+def parse_factmap_keys(factmap, n_down, n_across):
+    """Parse the factMap keys, such as "0_1!T", keeping only those of groups
+    in the innermost grouping down and across, i.e., not sub/grandtotals,
+    sorted by their group indices.
+
+    Returns
+    -------
+    list
+        Tuples with the key, its groupings down and its groupings across.
     """
-    all_groups = []
-    for group in groups:
-        groups_labels = get_groups_labels([group], [])
-        all_groups.extend(itertools.product(*groups_labels))
-    return all_groups
+    keys = []
+
+    for key in factmap:
+        down, across = map(parse_grouping_key, key.split("!"))
+
+        if len(down or ()) == n_down and len(across or ()) == n_across:
+            keys.append((key, down or (), across or ()))
+
+    return sorted(keys, key=lambda key: key[1:])
+
+
+def get_aggregates(factmap, keys, dtypes):
+    """Get the aggregates of the groups with the given factMap keys, as
+    returned by parse_factmap_keys, one array for each aggregate typed
+    according to its data type."""
+    aggregates = []
 
+    for i, dtype in enumerate(dtypes):
+        cells = [factmap[key]["aggregates"][i] for key, _, _ in keys]
+        values = get_values(cells, dtype)
 
-def get_groups_labels(groups, groupings_labels=[]):
-    """Recursively extract the labels for each
-    group, for every level of nesting.
+        if isinstance(values, list):
+            values = np.array(values, dtype=object)
+        aggregates.append(values)
+
+    return aggregates
+
+
+def get_groups_levels(groups, depth):
+    """Walk a tree of groupings once to get, for every level of nesting up to
+    depth, its unique labels and the code of each innermost group's label in
+    them, as needed by pandas.MultiIndex.
 
     Examples
     --------
-    >>> get_groups_labels(g)
-    [['grouping1'], ['grouping2'], ['grouping3_1', 'grouping3_2'], ['grouping4_1', 'grouping4_1']]
+    >>> g = [
+    ...     {"label": "a", "groupings": [{"label": "x", "groupings": []}]},
+    ...     {"label": "b", "groupings": [{"label": "x", "groupings": []},
+    ...                                  {"label": "y", "groupings": []}]},
+    ... ]
+    >>> get_groups_levels(g, 2)
+    ([['a', 'b'], ['x', 'y']], [array([0, 1, 1]), array([0, 0, 1])])
     """
-    labels = []
-    nested_groupings = []
+    levels = [[] for _ in range(depth)]
+    positions = [{} for _ in range(depth)]
+    codes = [[] for _ in range(depth)]
+
+    def walk(groups, path):
+        level = len(path)
+
+        for group in groups:
+            label = group["label"]
+
+            code = positions[level].get(label)
+            if code is None:
+                code = positions[level][label] = len(levels[level])
+                levels[level].append(label)
 
-    for group in groups:
-        labels.append(group["label"])
-        nested_groupings.extend(group["groupings"])
+            if level + 1 < depth:
+                walk(group["groupings"], path + (code,))
+            else:
+                for level_codes, level_code in zip(codes, path + (code,)):
+                    level_codes.append(level_code)
 
-    groupings_labels.append(labels)
-    if nested_groupings:
-        get_groups_labels(nested_groupings, groupings_labels)
+    walk(groups, ())
 
-    return groupings_labels
+    return levels, [np.array(level_codes, dtype=np.intp) for level_codes in codes]
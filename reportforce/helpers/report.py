@@ -15,11 +15,28 @@ class Report(dict):
     def extended_metadata(self):
         return self["reportExtendedMetadata"]
 
+    def to_page(self, output="pandas"):
+        """Get the report as a DataFrame, or as an Arrow table if output is
+        "arrow"."""
+        if output == "arrow":
+            return self.to_arrow()
+        return self.to_dataframe()
+
     def get_columns_info(self):
         return self.extended_metadata[
             "detailColumnInfo" if self.format != "MATRIX" else "aggregateColumnInfo"
         ]
 
+    @property
+    def has_detail_rows(self):
+        return self.report_metadata.get("hasDetailRows", True)
+
+    def get_aggregates_info(self):
+        """Get the info of every aggregate, in the order of the aggregates in
+        the factMap."""
+        infos = self.extended_metadata["aggregateColumnInfo"]
+        return [infos[name] for name in self.report_metadata["aggregates"]]
+
     def get_column_dtype(self, label):
         for _, info in self.get_columns_info().items():
             if info["label"] == label:
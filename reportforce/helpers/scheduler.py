@@ -0,0 +1,143 @@
+import time
+import heapq
+import itertools
+import threading
+import contextlib
+
+# Salesforce allows 500 synchronous report runs per hour and 20 concurrent
+# ones per org
+DEFAULT_RATE_LIMIT = 500
+DEFAULT_PERIOD = 3600
+DEFAULT_MAX_CONCURRENCY = 20
+
+DEFAULT_PRIORITY = 10
+
+
+class TokenBucket:
+    """Token bucket holding up to `capacity` tokens, refilled at a rate of
+    `capacity` tokens per `period` seconds.
+
+    It is not thread-safe on its own, callers must hold a lock.
+    """
+
+    def __init__(self, capacity, period):
+        self.capacity = capacity
+        self.rate = capacity / period
+        self.tokens = capacity
+        self.updated_at = time.monotonic()
+
+    def refill(self):
+        now = time.monotonic()
+        self.tokens = min(
+            self.capacity, self.tokens + (now - self.updated_at) * self.rate
+        )
+        self.updated_at = now
+
+    def consume(self):
+        """Take a token, returning 0, or return how many seconds to wait until
+        there is one if the bucket is empty."""
+        self.refill()
+
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return 0
+
+        return (1 - self.tokens) / self.rate
+
+
+class Scheduler:
+    """Scheduler of the requests made to a Salesforce org, keeping them under
+    its rate and concurrency limits.
+
+    Requests wait in a priority queue, the ones with the lowest priority
+    number first and, among those, the ones that arrived first. The request at
+    the head of the queue starts once there is a free concurrency slot and a
+    token in the bucket.
+
+    Attributes
+    ----------
+    rate_limit : int (optional), default 500
+        Maximum number of requests per period, None for no limit.
+
+    period : int, float, default 3600
+        Period of the rate limit, in seconds.
+
+    max_concurrency : int (optional), default 20
+        Maximum number of requests running at the same time, None for no
+        limit.
+
+    Examples
+    --------
+    >>> scheduler = Scheduler(rate_limit=100, max_concurrency=5)
+    >>> rf = Reportforce("user", "pass", "token", scheduler=scheduler)
+    >>> rf.get_report("00O1a000001YtFG", priority=0)
+    """
+
+    def __init__(
+        self,
+        rate_limit=DEFAULT_RATE_LIMIT,
+        period=DEFAULT_PERIOD,
+        max_concurrency=DEFAULT_MAX_CONCURRENCY,
+    ):
+        self.rate_limit = rate_limit
+        self.period = period
+        self.max_concurrency = max_concurrency
+
+        self.bucket = TokenBucket(rate_limit, period) if rate_limit else None
+        self.running = 0
+
+        self._queue = []
+        self._counter = itertools.count()
+        self._condition = threading.Condition()
+
+    def _has_free_slot(self):
+        return self.max_concurrency is None or self.running < self.max_concurrency
+
+    def acquire(self, priority=DEFAULT_PRIORITY):
+        """Block until it is the turn of a request with the given priority."""
+        entry = (priority, next(self._counter))
+
+        with self._condition:
+            heapq.heappush(self._queue, entry)
+
+            while True:
+                if self._queue[0] == entry and self._has_free_slot():
+                    wait = self.bucket.consume() if self.bucket else 0
+                    if not wait:
+                        break
+                    self._condition.wait(wait)
+                else:
+                    self._condition.wait()
+
+            heapq.heappop(self._queue)
+            self.running += 1
+
+            # let the next request in the queue check its turn
+            self._condition.notify_all()
+
+    def release(self):
+        with self._condition:
+            self.running -= 1
+            self._condition.notify_all()
+
+    @contextlib.contextmanager
+    def slot(self, priority=DEFAULT_PRIORITY):
+        """Context manager to run a request in its turn."""
+        self.acquire(priority)
+        try:
+            yield
+        finally:
+            self.release()
+
+
+_schedulers = {}
+_schedulers_lock = threading.Lock()
+
+
+def get_scheduler(instance_url):
+    """Get the scheduler shared by every client of a Salesforce instance,
+    making one with the default limits if there is none yet."""
+    with _schedulers_lock:
+        if instance_url not in _schedulers:
+            _schedulers[instance_url] = Scheduler()
+        return _schedulers[instance_url]
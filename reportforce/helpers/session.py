@@ -0,0 +1,154 @@
+import random
+import requests
+
+from urllib.parse import urlsplit
+from requests.adapters import HTTPAdapter
+from urllib3.util import retry
+
+DEFAULT_POOL_SIZE = 10
+DEFAULT_MAX_RETRIES = 3
+DEFAULT_BACKOFF_FACTOR = 0.5
+
+# urllib3 only honors the Retry-After header for these statuses
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+# synchronous report runs are read-only, even if they are POST requests, but
+# posting to the instances endpoint starts a new asynchronous run every time
+RETRY_METHODS = frozenset(["GET", "POST"])
+NO_RETRY_PATH = "/instances"
+
+
+class Retry(retry.Retry):
+    """Retry policy with exponential backoff plus a random jitter, so that
+    requests which failed together do not retry all at once.
+
+    A Retry-After header, if there is one, is honored instead. Asynchronous
+    report runs, which are posted to the instances endpoint, are never
+    retried, so that a run is not started twice.
+
+    Attributes
+    ----------
+    jitter : float, default 0.5
+        Maximum number of seconds added to each backoff.
+    """
+
+    def __init__(self, *args, jitter=0.5, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.jitter = jitter
+
+    def new(self, **kwargs):
+        new_retry = super().new(**kwargs)
+        new_retry.jitter = self.jitter
+        return new_retry
+
+    def increment(self, method=None, url=None, *args, **kwargs):
+        if method == "POST" and urlsplit(url or "").path.endswith(NO_RETRY_PATH):
+            # give up at once, as if there were no retries left
+            exhausted = self.new(total=0)
+            return super(Retry, exhausted).increment(method, url, *args, **kwargs)
+        return super().increment(method, url, *args, **kwargs)
+
+    def get_backoff_time(self):
+        backoff = super().get_backoff_time()
+        if backoff <= 0:
+            return 0
+        return backoff + random.uniform(0, self.jitter)
+
+
+class ScheduledSession(requests.Session):
+    """Session whose report runs wait for their turn in a scheduler.
+
+    Only requests given a `priority` keyword argument, lower numbers running
+    first, go through the scheduler. The others, such as describes and
+    polls, which do not count against the org report limits, run at once.
+    """
+
+    def __init__(self, scheduler):
+        super().__init__()
+        self.scheduler = scheduler
+
+    def request(self, method, url, *args, priority=None, **kwargs):
+        if priority is None:
+            return super().request(method, url, *args, **kwargs)
+
+        with self.scheduler.slot(priority):
+            return super().request(method, url, *args, **kwargs)
+
+
+def make_session(
+    pool_size=DEFAULT_POOL_SIZE,
+    max_retries=DEFAULT_MAX_RETRIES,
+    backoff_factor=DEFAULT_BACKOFF_FACTOR,
+    keep_alive=True,
+    scheduler=None,
+):
+    """Make a session with its own connection pool, which retries requests
+    throttled with a 429 status or failing with a 5xx status or a connection
+    error.
+
+    Parameters
+    ----------
+    pool_size : int, default 10
+        Number of connections kept open to the Salesforce instance, which
+        should be at least the number of concurrent requests.
+
+    max_retries : int, default 3
+        Number of retries, 0 to disable them.
+
+    backoff_factor : float, default 0.5
+        Retries wait for backoff_factor * 2 ** (retry number - 1) seconds.
+
+    keep_alive : bool, default True
+        Whether or not to reuse connections between requests.
+
+    scheduler : Scheduler (optional)
+        Scheduler through which requests given a priority go.
+
+    Returns
+    -------
+    requests.Session
+    """
+    max_retries = Retry(
+        total=max_retries,
+        backoff_factor=backoff_factor,
+        status_forcelist=RETRY_STATUSES,
+        allowed_methods=RETRY_METHODS,
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(
+        pool_connections=pool_size, pool_maxsize=pool_size, max_retries=max_retries
+    )
+
+    session = requests.Session() if scheduler is None else ScheduledSession(scheduler)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+
+    if not keep_alive:
+        session.headers["Connection"] = "close"
+
+    return session
+
+
+def get_pool_size(session, url):
+    """Get the number of connections a session pools for a URL, or None if
+    its adapter does not say."""
+    return getattr(session.get_adapter(url), "_pool_maxsize", None)
+
+
+def grow_pool(session, url, pool_size):
+    """Remount the adapter of a session made by make_session for a URL with a
+    pool of pool_size connections, keeping its retries, if its pool is
+    smaller. Requests in flight finish on the old pool."""
+    adapter = session.get_adapter(url)
+
+    if get_pool_size(session, url) >= pool_size:
+        return
+
+    grown = HTTPAdapter(
+        pool_connections=pool_size,
+        pool_maxsize=pool_size,
+        max_retries=adapter.max_retries,
+    )
+    for prefix, mounted in list(session.adapters.items()):
+        if mounted is adapter:
+            session.mount(prefix, grown)
@@ -0,0 +1,98 @@
+import os
+import pandas as pd
+
+from reportforce.helpers import arrow
+
+parquet_suffixes = (".parquet", ".pq")
+
+
+def get_fields(metadata):
+    """Get the label and data type of every column a report page has, once its
+    groupings are turned into columns, from the report metadata."""
+    if metadata.report_format == "MATRIX":
+        raise ValueError("Only tabular and summary reports can be written to a sink")
+
+    fields = []
+
+    if metadata.report_format == "SUMMARY":
+        groupings_info = metadata.extended_metadata["groupingColumnInfo"]
+        for grouping in metadata.report_metadata["groupingsDown"]:
+            fields.append((groupings_info[grouping["name"]]["label"], "string"))
+
+    for column in metadata.detail_columns:
+        fields.append(
+            (metadata.get_column_label(column), metadata.get_column_dtype(column))
+        )
+
+    return fields
+
+
+def flatten(df):
+    """Turn the groupings of a summary report into columns."""
+    if isinstance(df.index, pd.MultiIndex):
+        return df.reset_index()
+    return df
+
+
+class CsvSink:
+    """Write pages into a CSV file, or file object, as they arrive."""
+
+    def __init__(self, sink, fields):
+        self.columns = [label for label, _ in fields]
+
+        if hasattr(sink, "write"):
+            self.file, self.owns_file = sink, False
+        else:
+            self.file, self.owns_file = open(sink, "w", newline=""), True
+
+        pd.DataFrame(columns=self.columns).to_csv(self.file, index=False)
+
+    def write(self, df):
+        # in the order of the header, raising a KeyError for missing columns
+        flatten(df)[self.columns].to_csv(self.file, header=False, index=False)
+
+    def close(self):
+        if self.owns_file:
+            self.file.close()
+
+
+class ParquetSink:
+    """Write pages into a Parquet file as they arrive, one row group each."""
+
+    def __init__(self, sink, fields):
+        import pyarrow.parquet as pq
+
+        self.schema = arrow.get_schema(fields)
+        self.writer = pq.ParquetWriter(sink, self.schema)
+
+    def write(self, df):
+        self.writer.write_table(arrow.from_pandas(flatten(df), self.schema))
+
+    def close(self):
+        self.writer.close()
+
+
+def get_sink(sink, metadata):
+    """Get a sink given a path or a file object. Paths ending with .parquet or
+    .pq are written as Parquet, anything else as CSV."""
+    fields = get_fields(metadata)
+
+    if not hasattr(sink, "write") and os.fspath(sink).endswith(parquet_suffixes):
+        return ParquetSink(os.fspath(sink), fields)
+
+    return CsvSink(sink, fields)
+
+
+def write_pages(sink, pages):
+    """Write every page into the sink, closing it afterwards, and return the
+    number of rows written."""
+    n_rows = 0
+
+    try:
+        for df in pages:
+            sink.write(df)
+            n_rows += len(df)
+    finally:
+        sink.close()
+
+    return n_rows
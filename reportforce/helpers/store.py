@@ -0,0 +1,121 @@
+import sqlite3
+import contextlib
+import pandas as pd
+
+SYNC_TABLE = "reportforce_sync"
+
+
+def quote(name):
+    return '"{}"'.format(str(name).replace('"', '""'))
+
+
+class ReportStore:
+    """Local copy of a report in a SQLite table, where rows are upserted by a
+    unique column, along with the high-water mark of the column telling when
+    rows were last modified.
+
+    Attributes
+    ----------
+    path : str
+        Path to the SQLite database.
+
+    table : str
+        Name of the table holding the report rows.
+    """
+
+    def __init__(self, path, table, timeout=30):
+        self.path = path
+        self.table = table
+        self.timeout = timeout
+
+        with self._connect() as connection:
+            connection.execute(
+                """CREATE TABLE IF NOT EXISTS {} (
+                    name TEXT PRIMARY KEY,
+                    high_water_mark TEXT
+                )""".format(SYNC_TABLE)
+            )
+
+    @contextlib.contextmanager
+    def _connect(self):
+        connection = sqlite3.connect(self.path, timeout=self.timeout)
+        try:
+            with connection:
+                yield connection
+        finally:
+            connection.close()
+
+    @property
+    def high_water_mark(self):
+        """Greatest modified date seen so far, as a Timestamp, or None if the
+        report was never synced."""
+        with self._connect() as connection:
+            row = connection.execute(
+                "SELECT high_water_mark FROM {} WHERE name = ?".format(SYNC_TABLE),
+                (self.table,),
+            ).fetchone()
+
+        if row is not None and row[0] is not None:
+            return pd.Timestamp(row[0])
+
+    def _table_exists(self, connection):
+        row = connection.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?",
+            (self.table,),
+        ).fetchone()
+        return row is not None
+
+    def upsert(self, df, id_column, modified_column):
+        """Insert rows, replacing those with the same id_column value, and move
+        the high-water mark to the greatest value of modified_column."""
+        if df.empty:
+            return
+
+        staging = self.table + "_staging"
+        columns = ", ".join(map(quote, df.columns))
+
+        marks = [self.high_water_mark, df[modified_column].max()]
+        marks = [mark for mark in marks if mark is not None and not pd.isna(mark)]
+
+        with self._connect() as connection:
+            df.to_sql(staging, connection, index=False, if_exists="replace")
+
+            if self._table_exists(connection):
+                connection.execute(
+                    "DELETE FROM {table} WHERE {id} IN (SELECT {id} FROM {staging})".format(
+                        table=quote(self.table), id=quote(id_column), staging=quote(staging)
+                    )
+                )
+                connection.execute(
+                    "INSERT INTO {table} ({columns}) SELECT {columns} FROM {staging}".format(
+                        table=quote(self.table), columns=columns, staging=quote(staging)
+                    )
+                )
+            else:
+                connection.execute(
+                    "CREATE TABLE {} AS SELECT * FROM {}".format(
+                        quote(self.table), quote(staging)
+                    )
+                )
+                connection.execute(
+                    "CREATE INDEX {} ON {} ({})".format(
+                        quote(self.table + "_" + str(id_column)),
+                        quote(self.table),
+                        quote(id_column),
+                    )
+                )
+
+            connection.execute("DROP TABLE {}".format(quote(staging)))
+
+            if marks:
+                connection.execute(
+                    "INSERT OR REPLACE INTO {} VALUES (?, ?)".format(SYNC_TABLE),
+                    (self.table, max(marks).isoformat()),
+                )
+
+    def read(self):
+        """Read every stored row into a DataFrame."""
+        with self._connect() as connection:
+            if not self._table_exists(connection):
+                return pd.DataFrame()
+            return pd.read_sql("SELECT * FROM {}".format(quote(self.table)), connection)
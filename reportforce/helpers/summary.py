@@ -1,56 +1,115 @@
-import re
-import itertools
+import numpy as np
 import pandas as pd
 
-from distutils.version import LooseVersion
-
-from ..helpers import parsers
+from ..helpers import arrow, parsers
 from ..helpers.report import Report
 
 
 class Summary(Report):
-    def get_cells(self):
+    def get_rows(self):
+        """Get the rows of every group, in order, along with how many rows
+        each group has."""
         factmap = self["factMap"]
 
-        cells = []
+        rows = []
         group_frequency = []
 
-        # pattern to filter out sub/grandtotals
         n_groups = len(self.report_metadata["groupingsDown"])
-        pattern = r"_".join(["[0-9]"] * n_groups)
+        keys = parsers.parse_factmap_keys(factmap, n_groups, 0)
+
+        for key, _, _ in keys:
+            group_rows = factmap[key]["rows"]
+            rows.extend(group_rows)
+            group_frequency.append(len(group_rows))
+
+        return rows, group_frequency
 
-        # filter out all keys that are sub/grandtotals
-        groups = [group for group in factmap if re.search(pattern, group)]
+    def get_cells(self):
+        rows, group_frequency = self.get_rows()
         dtypes = self.get_columns_dtypes()
 
-        for group in sorted(groups, key=LooseVersion):
-            rows = factmap[group]["rows"]
-            for row in rows:
-                data_cells = row["dataCells"]
-                cells.append(
-                    [
-                        parsers.get_value(cell, dtype)
-                        for cell, dtype in zip(data_cells, dtypes)
-                    ]
-                )
-            group_frequency.append(len(rows))
+        cells = [
+            [parsers.get_value(cell, dtype) for cell, dtype in zip(row["dataCells"], dtypes)]
+            for row in rows
+        ]
 
         return cells, group_frequency
 
-    def get_index(self, group_frequency):
-        groups = parsers.get_groups(self["groupingsDown"]["groupings"])
-        groups_frequency_pairs = zip(groups, group_frequency)
-
-        repeated_groups = itertools.chain.from_iterable(
-            itertools.starmap(itertools.repeat, groups_frequency_pairs)
+    def get_levels(self, group_frequency):
+        """Get the labels of every grouping and the codes of each row's groups
+        in them, repeating the codes of each group for each of its rows."""
+        levels, codes = parsers.get_groups_levels(
+            self["groupingsDown"]["groupings"],
+            len(self.report_metadata["groupingsDown"]),
         )
 
+        # an empty factMap has no groups at all, even if there are groupings
+        if not group_frequency:
+            return levels, [level_codes[:0] for level_codes in codes]
+
+        return levels, [np.repeat(level_codes, group_frequency) for level_codes in codes]
+
+    def get_index(self, group_frequency):
+        levels, codes = self.get_levels(group_frequency)
         names = self.get_groupings_down_labels()
-        return pd.MultiIndex.from_tuples(repeated_groups, names=names)
+
+        return pd.MultiIndex(levels=levels, codes=codes, names=names)
+
+    def get_aggregates_dataframe(self):
+        """Get a row with the aggregates of each group, for reports without
+        detail rows."""
+        factmap = self["factMap"]
+
+        n_groups = len(self.report_metadata["groupingsDown"])
+        keys = parsers.parse_factmap_keys(factmap, n_groups, 0)
+
+        infos = self.get_aggregates_info()
+        dtypes = [info["dataType"] for info in infos]
+        aggregates = parsers.get_aggregates(factmap, keys, dtypes)
+
+        df = pd.DataFrame(dict(enumerate(aggregates)))
+        df.index = self.get_index([1] * len(keys))
+        df.columns = [info["label"] for info in infos]
+
+        return df
 
     def to_dataframe(self):
+        if not self.has_detail_rows:
+            return self.get_aggregates_dataframe()
+
         cells, group_frequency = self.get_cells()
         index = self.get_index(group_frequency)
         columns = self.get_columns_labels()
 
         return pd.DataFrame(cells, columns=columns, index=index)
+
+    def to_arrow(self):
+        """Get the report as an Arrow table built straight from the factMap,
+        with a string column for each grouping followed by the detail
+        columns."""
+        rows, group_frequency = self.get_rows()
+
+        groupings_labels = self.get_groupings_down_labels()
+        labels = self.get_columns_labels()
+        dtypes = self.get_columns_dtypes()
+
+        levels, codes = self.get_levels(group_frequency)
+        groups = [
+            np.array(labels, dtype=object)[level_codes]
+            for labels, level_codes in zip(levels, codes)
+        ]
+
+        if rows:
+            columns = zip(*(row["dataCells"] for row in rows))
+        else:
+            columns = [()] * len(dtypes)
+
+        arrays = [arrow.pa.array(values, type=arrow.pa.string()) for values in groups]
+        arrays.extend(
+            arrow.get_array(cells, dtype) for cells, dtype in zip(columns, dtypes)
+        )
+
+        fields = [(label, "string") for label in groupings_labels]
+        fields.extend(zip(labels, dtypes))
+
+        return arrow.pa.Table.from_arrays(arrays, schema=arrow.get_schema(fields))
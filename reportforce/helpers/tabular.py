@@ -1,6 +1,6 @@
 import pandas as pd
 
-from ..helpers import parsers
+from ..helpers import arrow, parsers
 from ..helpers.report import Report
 
 
@@ -9,19 +9,39 @@ class Tabular(Report):
     def rows(self):
         return self["factMap"]["T!T"]["rows"]
 
-    def get_cells(self):
+    def get_columns(self):
+        """Get the cells column by column, each converted at once according to
+        its data type."""
+        columns = zip(*(row["dataCells"] for row in self.rows))
         dtypes = self.get_columns_dtypes()
 
         return [
-            [
-                parsers.get_value(cell, dtype)
-                for cell, dtype in zip(row["dataCells"], dtypes)
-            ]
-            for row in self.rows
+            parsers.get_values(cells, dtype) for cells, dtype in zip(columns, dtypes)
         ]
 
     def to_dataframe(self):
-        cells = self.get_cells()
-        columns = self.get_columns_labels()
+        labels = self.get_columns_labels()
 
-        return pd.DataFrame(cells, columns=columns)
+        if not self.rows:
+            return pd.DataFrame(columns=labels)
+
+        df = pd.DataFrame(dict(enumerate(self.get_columns())))
+        df.columns = labels
+
+        return df
+
+    def to_arrow(self):
+        """Get the report as an Arrow table built straight from the factMap,
+        without going through pandas."""
+        labels = self.get_columns_labels()
+        dtypes = self.get_columns_dtypes()
+
+        if self.rows:
+            columns = zip(*(row["dataCells"] for row in self.rows))
+        else:
+            columns = [()] * len(dtypes)
+
+        arrays = [arrow.get_array(cells, dtype) for cells, dtype in zip(columns, dtypes)]
+        schema = arrow.get_schema(zip(labels, dtypes))
+
+        return arrow.pa.Table.from_arrays(arrays, schema=schema)
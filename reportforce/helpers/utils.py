@@ -1,3 +1,4 @@
+import datetime
 import pandas as pd
 
 
@@ -20,3 +21,35 @@ def reset_useless_index(df):
         return df
     else:
         return df.reset_index(drop=True)
+
+
+def split_date_range(start, end, n):
+    """Split the days between start and end, both inclusive, into at most n
+    contiguous and non-overlapping windows.
+
+    Examples
+    --------
+    >>> split_date_range(date(2020, 1, 1), date(2020, 1, 4), 2)
+    [(date(2020, 1, 1), date(2020, 1, 2)), (date(2020, 1, 3), date(2020, 1, 4))]
+    """
+    n_days = (end - start).days + 1
+    n = max(1, min(n, n_days))
+
+    one_day = datetime.timedelta(days=1)
+    bounds = [start + datetime.timedelta(days=n_days * i // n) for i in range(n + 1)]
+
+    return [(lower, upper - one_day) for lower, upper in zip(bounds, bounds[1:])]
+
+
+def backoff_delays(initial, maximum, factor=2):
+    """Generate delays growing exponentially from initial up to maximum.
+
+    Examples
+    --------
+    >>> list(itertools.islice(backoff_delays(1, 5), 5))
+    [1, 2, 4, 5, 5]
+    """
+    delay = initial
+    while True:
+        yield min(delay, maximum)
+        delay *= factor
@@ -3,6 +3,7 @@ import requests
 from getpass import getpass
 from xml.sax.saxutils import escape
 
+from .helpers import decoder
 from .helpers.xml import read_failed_response, read_successful_response
 
 DEFAULT_VERSION = "47.0"
@@ -65,7 +66,7 @@ class Salesforce:
 
     def _get_latest_version(self):
         url = "https://{}/services/data/".format(self.instance_url)
-        version = requests.get(url).json()[-1]["version"]
+        version = decoder.decode(requests.get(url))[-1]["version"]
         return version
 
 
@@ -14,6 +14,11 @@ setuptools.setup(
     url="https://github.com/phelipetls/reportforce",
     packages=setuptools.find_packages(),
     install_requires=["pandas", "requests"],
+    extras_require={
+        "orjson": ["orjson"],
+        "parquet": ["pyarrow"],
+        "excel": ["openpyxl"],
+    },
     classifiers=[
         "Programming Language :: Python :: 3",
         "License :: OSI Approved :: MIT License",
@@ -1,7 +1,7 @@
+import requests
 import pytest
 import reportforce
 
-from reportforce import Reportforce
 from reportforce.helpers.metadata import Metadata
 
 from fixtures_utils import MockJsonResponse
@@ -10,7 +10,7 @@ from fixtures_utils import MockJsonResponse
 @pytest.fixture
 def mock_http_request(monkeypatch):
     """
-    Do not make a HTTP request via Reportforce.session,
+    Do not make a HTTP request via requests.Session,
     return a local file instead.
     """
 
@@ -18,7 +18,7 @@ def mock_http_request(monkeypatch):
         response = MockJsonResponse(data)
 
         monkeypatch.setattr(
-            Reportforce.session, method, lambda *args, **kwargs: response
+            requests.Session, method, lambda *args, **kwargs: response
         )
 
     return _mock_http_request
@@ -38,7 +38,7 @@ def mock_generate_reports(mocker):
 
         generator = map(MockJsonResponse, [all_data_false] * n + [data])
 
-        mocker.patch.object(Reportforce.session, "post", side_effect=generator)
+        mocker.patch.object(requests.Session, "post", side_effect=generator)
 
     return _mock_generate_reports
 
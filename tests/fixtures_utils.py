@@ -17,6 +17,8 @@ class MockJsonResponse:
     def __init__(self, data, *args, **kwargs):
         self.data = data
         self.status_code = 200
+        self.headers = {"Content-Type": "application/json"}
+        self.content = json.dumps(data).encode()
 
     def json(self):
         return self.data
@@ -0,0 +1,80 @@
+import copy
+import pytest
+
+from reportforce import Reportforce
+from reportforce.helpers.metadata import Metadata
+from reportforce.helpers.summary import Summary
+
+from fixtures_utils import read_json
+
+METADATA = read_json("tabular_metadata.json")
+
+SUMMARY_REPORT = read_json("summary.json")
+SUMMARY_REPORT["reportMetadata"]["hasDetailRows"] = False
+
+URL = "https://www.salesforce.com/services/data/v47.0/analytics/reports/ID"
+
+
+def test_group_by():
+    metadata = Metadata(copy.deepcopy(METADATA))
+    metadata.group_by(
+        ["Opportunity Owner", ("Created Date", "Month")],
+        aggregates=["count", ("sum", "Amount"), "a!AGE"],
+    )
+
+    assert metadata.report_format == "SUMMARY"
+    assert metadata.report_metadata["hasDetailRows"] is False
+    assert metadata.report_metadata["aggregates"] == ["RowCount", "s!AMOUNT", "a!AGE"]
+    assert [
+        (grouping["name"], grouping["dateGranularity"])
+        for grouping in metadata.report_metadata["groupingsDown"]
+    ] == [("FULL_NAME", "None"), ("CREATED_DATE", "Month")]
+
+
+def test_group_by_across():
+    metadata = Metadata(copy.deepcopy(METADATA))
+    metadata.group_by(["Opportunity Owner"], across=["Fiscal Period"])
+
+    assert metadata.report_format == "MATRIX"
+    assert metadata.report_metadata["groupingsAcross"][0]["name"] == "FISCAL_QUARTER"
+
+
+@pytest.mark.parametrize(
+    "aggregate", [("median", "Amount"), ("sum", "Unknown Column")]
+)
+def test_invalid_aggregate(aggregate):
+    with pytest.raises(ValueError):
+        Metadata(copy.deepcopy(METADATA)).group_by(["Age"], aggregates=[aggregate])
+
+
+def test_summary_aggregates():
+    """Test if a summary report without detail rows gets a row per group."""
+    df = Summary(SUMMARY_REPORT).to_dataframe()
+
+    factmap = SUMMARY_REPORT["factMap"]
+    keys = [key for key in factmap if key.count("_") == 2]
+    keys.sort(key=lambda key: tuple(map(int, key[:-2].split("_"))))
+
+    assert list(df.columns) == ["label"]
+    assert df["label"].dtype == "int64"
+    assert df["label"].tolist() == [
+        factmap[key]["aggregates"][0]["value"] for key in keys
+    ]
+    assert df.index.nlevels == 3
+
+
+def test_aggregate_report(mock_login, mock_get_metadata, requests_mock):
+    mock_get_metadata(METADATA)
+    requests_mock.post(URL, json=SUMMARY_REPORT)
+
+    rf = Reportforce("foo@bar.com", "1234", "token")
+    df = rf.aggregate_report(
+        "ID", down=["Opportunity Owner"], filters=[("Age", ">", 1)]
+    )
+
+    payload = requests_mock.last_request.json()["reportMetadata"]
+    assert payload["hasDetailRows"] is False
+    assert payload["groupingsDown"][0]["name"] == "FULL_NAME"
+    assert payload["reportFilters"]
+
+    assert len(df) == len(Summary(SUMMARY_REPORT).to_dataframe())
@@ -0,0 +1,144 @@
+import asyncio
+import requests
+import threading
+
+import pandas as pd
+
+from reportforce import AsyncReportforce
+from reportforce.helpers.store import ReportStore
+from reportforce.helpers.tabular import Tabular
+
+from fixtures_utils import MockJsonResponse, read_json
+
+REPORT = read_json("tabular.json")
+METADATA = read_json("tabular_metadata.json")
+
+
+def test_get_report(mock_login, mock_http_request, mock_get_metadata):
+    """Test if the coroutine gives the same DataFrame as the synchronous parser."""
+    mock_get_metadata(METADATA)
+    mock_http_request(REPORT, "post")
+
+    async def main():
+        async with AsyncReportforce("foo@bar.com", "1234", "token") as rf:
+            return await rf.get_report("ID")
+
+    df = asyncio.run(main())
+
+    pd.testing.assert_frame_equal(df, Tabular(REPORT).to_dataframe())
+
+
+def test_get_many_reports(mock_login, mock_http_request, mock_get_metadata):
+    """Test fetching reports concurrently."""
+    mock_get_metadata(METADATA)
+    mock_http_request(REPORT, "post")
+
+    async def main():
+        async with AsyncReportforce(
+            "foo@bar.com", "1234", "token", max_concurrency=2
+        ) as rf:
+            return await asyncio.gather(*(rf.get_report("ID") for _ in range(4)))
+
+    assert len(asyncio.run(main())) == 4
+
+
+def test_get_report_with_id_column(
+    mock_login, mock_generate_reports, mock_get_metadata
+):
+    """Test if it keeps requesting until allData is True."""
+    mock_generate_reports(REPORT, n=1)
+    mock_get_metadata(METADATA)
+
+    async def main():
+        async with AsyncReportforce("foo@bar.com", "1234", "token") as rf:
+            return await rf.get_report("ID", id_column="Opportunity Name")
+
+    assert len(asyncio.run(main())) == 1
+
+
+def test_iter_report(mock_login, mock_generate_reports, mock_get_metadata):
+    """Test if it yields one DataFrame per page."""
+    mock_generate_reports(REPORT, n=1)
+    mock_get_metadata(METADATA)
+
+    async def main():
+        async with AsyncReportforce("foo@bar.com", "1234", "token") as rf:
+            return [df async for df in rf.iter_report("ID", id_column="Age")]
+
+    assert [len(df) for df in asyncio.run(main())] == [1, 0]
+
+
+def test_sync_report(mock_login, mock_get_metadata, mocker, tmp_path):
+    """Test if the second sync starts from the high-water mark of the first."""
+    mock_get_metadata(METADATA)
+    post = mocker.patch.object(
+        requests.Session, "post", side_effect=lambda *a, **k: MockJsonResponse(REPORT)
+    )
+
+    async def main():
+        async with AsyncReportforce("foo@bar.com", "1234", "token") as rf:
+            for _ in range(2):
+                await rf.sync_report(
+                    "ID",
+                    str(tmp_path / "store.sqlite"),
+                    id_column="Opportunity Name",
+                    modified_column="Created Date",
+                )
+
+    asyncio.run(main())
+
+    date_filter = post.call_args.kwargs["json"]["reportMetadata"]["standardDateFilter"]
+    assert date_filter["startDate"] == "2015-07-30"
+    assert len(ReportStore(str(tmp_path / "store.sqlite"), "ID").read()) == 1
+
+
+def test_date_windows_are_streamed(mock_login, mock_get_metadata, mocker):
+    mock_get_metadata(METADATA)
+
+    first_page_yielded = threading.Event()
+    timed_out = []
+
+    def post(url, json, **kwargs):
+        if json["reportMetadata"]["standardDateFilter"]["startDate"] > "2020-01-15":
+            timed_out.append(not first_page_yielded.wait(1))
+        return MockJsonResponse(REPORT)
+
+    mocker.patch.object(requests.Session, "post", side_effect=post)
+
+    async def main():
+        async with AsyncReportforce("foo@bar.com", "1234", "token") as rf:
+            pages = rf.iter_report(
+                "ID", start="01-01-2020", end="31-01-2020", date_windows=2
+            )
+            await pages.__anext__()
+            first_page_yielded.set()
+
+            return [df async for df in pages]
+
+    assert len(asyncio.run(main())) == 1
+    assert timed_out == [False]
+
+
+def test_pages_are_parsed_off_the_event_loop(
+    mock_login, mock_generate_reports, mock_get_metadata, monkeypatch
+):
+    mock_get_metadata(METADATA)
+    mock_generate_reports(REPORT, n=1)
+
+    threads = []
+    to_page = Tabular.to_page
+
+    def record_thread(*args, **kwargs):
+        threads.append(threading.current_thread())
+        return to_page(*args, **kwargs)
+
+    monkeypatch.setattr(Tabular, "to_page", record_thread)
+
+    async def main():
+        async with AsyncReportforce("foo@bar.com", "1234", "token") as rf:
+            return [df async for df in rf.iter_report("ID", id_column="Age")]
+
+    asyncio.run(main())
+
+    assert len(threads) == 2
+    assert threading.main_thread() not in threads
@@ -0,0 +1,99 @@
+import copy
+import pytest
+
+from reportforce import Reportforce
+from reportforce.helpers.tabular import Tabular
+from reportforce.helpers.summary import Summary
+from reportforce.helpers.matrix import Matrix
+
+from fixtures_utils import read_json
+
+pa = pytest.importorskip("pyarrow")
+
+REPORT = read_json("tabular.json")
+METADATA = read_json("tabular_metadata.json")
+
+
+def test_tabular_to_arrow():
+    table = Tabular(REPORT).to_arrow()
+    df = Tabular(REPORT).to_dataframe()
+
+    assert table.column_names == list(df.columns)
+    assert table.schema.field("Age").type == pa.int64()
+    assert table.schema.field("Amount").type == pa.float64()
+    assert table.column("Opportunity Name").to_pylist() == df["Opportunity Name"].tolist()
+    assert table.column("Age").to_pylist() == df["Age"].tolist()
+
+
+def test_empty_tabular_to_arrow():
+    report = copy.deepcopy(REPORT)
+    report["factMap"]["T!T"]["rows"] = []
+
+    table = Tabular(report).to_arrow()
+
+    assert table.num_rows == 0
+    assert table.schema == Tabular(REPORT).to_arrow().schema
+
+
+def test_summary_to_arrow():
+    report = read_json("summary.json")
+
+    table = Summary(report).to_arrow()
+    df = Summary(report).to_dataframe()
+
+    assert table.column_names == list(df.index.names) + list(df.columns)
+    rows = [list(group) + list(values) for group, values in zip(df.index, df.values)]
+    assert [list(row) for row in zip(*(column.to_pylist() for column in table.columns))] == rows
+
+
+def test_matrix_to_arrow(monkeypatch):
+    """Test if the table is built from the factMap with the same values and
+    types as the DataFrame, without going through it."""
+    report = read_json("matrix.json")
+    report["reportExtendedMetadata"]["aggregateColumnInfo"]["rowCount"][
+        "dataType"
+    ] = "double"
+    for cell in report["factMap"].values():
+        cell["aggregates"] = [{"label": "1", "value": 1.0}]
+
+    df = Matrix(report).to_dataframe()
+
+    with monkeypatch.context() as patch:
+        patch.setattr(Matrix, "to_dataframe", None)
+        table = Matrix(report).to_arrow()
+
+    assert table.column_names == list(df.index.names) + [
+        " / ".join(column) for column in df.columns
+    ]
+    assert table.schema.field("Row Sum / Product / DeliveryDay1").type == pa.float64()
+    rows = [list(group) + list(values) for group, values in zip(df.index, df.values)]
+    assert [list(row) for row in zip(*(column.to_pylist() for column in table.columns))] == rows
+
+
+def test_empty_matrix_to_arrow():
+    report = read_json("matrix.json")
+    report["factMap"] = {"T!T": {"aggregates": []}}
+
+    table = Matrix(report).to_arrow()
+
+    assert table.num_rows == 0
+    assert table.column_names == ["Supervisor", "Worker"]
+
+
+def test_get_report_as_arrow(mock_login, mock_generate_reports, mock_get_metadata):
+    """Test if pages are built as tables, with repeated rows dropped."""
+    mock_generate_reports(REPORT, n=1)
+    mock_get_metadata(METADATA)
+
+    rf = Reportforce("foo@bar.com", "1234", "token")
+    table = rf.get_report("ID", id_column="Age", output="arrow")
+
+    assert isinstance(table, pa.Table)
+    assert table.equals(Tabular(REPORT).to_arrow())
+
+
+def test_invalid_output(mock_login):
+    rf = Reportforce("foo@bar.com", "1234", "token")
+
+    with pytest.raises(ValueError):
+        rf.get_report("ID", output="polars")
@@ -0,0 +1,46 @@
+import pytest
+
+from reportforce import Reportforce
+
+from fixtures_utils import read_json
+
+REPORT = read_json("tabular.json")
+METADATA = read_json("tabular_metadata.json")
+
+URL = "https://www.salesforce.com/services/data/v47.0/analytics/reports/ID"
+
+
+@pytest.fixture
+def rf(mock_login, mock_get_metadata, requests_mock):
+    mock_get_metadata(METADATA)
+    requests_mock.post(URL, json=REPORT)
+
+    return Reportforce("foo@bar.com", "1234", "token")
+
+
+def get_posted_columns(requests_mock):
+    return requests_mock.last_request.json()["reportMetadata"]["detailColumns"]
+
+
+def test_columns(rf, requests_mock):
+    rf.get_report("ID", columns=["Amount", "Opportunity Name"])
+
+    assert get_posted_columns(requests_mock) == ["AMOUNT", "OPPORTUNITY_NAME"]
+
+
+def test_id_column_is_added(rf, requests_mock):
+    rf.get_report("ID", columns=["Amount"], id_column="Age")
+
+    assert get_posted_columns(requests_mock) == ["AMOUNT", "AGE"]
+
+
+def test_unknown_column(rf):
+    with pytest.raises(ValueError, match="Unknown column"):
+        rf.get_report("ID", columns=["Amount", "Unknown"])
+
+
+def test_cached_metadata_is_untouched(rf, requests_mock):
+    rf.get_report("ID", columns=["Amount"])
+    rf.get_report("ID")
+
+    assert get_posted_columns(requests_mock) == METADATA["reportMetadata"]["detailColumns"]
@@ -0,0 +1,47 @@
+import pytest
+import requests
+
+from reportforce.helpers import decoder
+
+
+def make_response(content):
+    response = requests.Response()
+    response.status_code = 200
+    response._content = content
+    return response
+
+
+@pytest.fixture(params=list(decoder.backends))
+def backend(request):
+    previous = decoder.current_backend
+    decoder.use_backend(request.param)
+    yield request.param
+    decoder.use_backend(previous)
+
+
+def test_decode(backend):
+    response = make_response('{"label": "São Paulo", "value": 1.5}'.encode())
+
+    assert decoder.decode(response) == {"label": "São Paulo", "value": 1.5}
+
+
+def test_decoded_body_is_cached(mocker):
+    loads = mocker.spy(decoder, "loads")
+    response = make_response(b'{"allData": true}')
+
+    assert decoder.decode(response) is decoder.decode(response)
+    assert loads.call_count == 1
+
+
+def test_register_backend(backend):
+    decoder.register_backend("constant", lambda content: "decoded")
+    decoder.use_backend("constant")
+
+    assert decoder.decode(make_response(b"{}")) == "decoded"
+
+    del decoder.backends["constant"]
+
+
+def test_unknown_backend():
+    with pytest.raises(ValueError):
+        decoder.use_backend("unknown")
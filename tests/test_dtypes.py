@@ -0,0 +1,73 @@
+import pytest
+import pandas as pd
+
+from reportforce import Reportforce
+from reportforce.helpers.dtypes import compact_dtypes, get_converter, to_boolean
+from reportforce.helpers.matrix import Matrix
+from reportforce.helpers.metadata import Metadata
+from reportforce.helpers.tabular import Tabular
+
+from fixtures_utils import read_json
+
+REPORT = read_json("tabular.json")
+METADATA = read_json("tabular_metadata.json")
+
+
+def test_compact_tabular():
+    df = compact_dtypes(Tabular(REPORT).to_dataframe(), Metadata(METADATA))
+
+    assert df.dtypes.astype(str).to_dict() == {
+        "Opportunity Name": "category",
+        "Amount": "float64",
+        "Lead Source": "float64",
+        "Next Step": "category",
+        "Probability (%)": "int64",
+        "Fiscal Period": "category",
+        "Age": "Int64",
+        "Created Date": "datetime64[ns]",
+        "Opportunity Owner": "category",
+        "Owner Role": "category",
+    }
+
+
+def test_compact_matrix():
+    """Test if matrix columns are converted according to their aggregate."""
+    report = read_json("matrix.json")
+    df = compact_dtypes(Matrix(report).to_dataframe(), Metadata(report))
+
+    assert (df.dtypes == "category").all()
+
+
+def test_to_boolean():
+    series = pd.Series(["true", "False", None])
+
+    assert to_boolean(series).tolist() == [True, False, pd.NA]
+
+
+def test_unique_ids_are_not_categoricals():
+    pytest.importorskip("pyarrow")
+    ids = pd.Series(["0061a000001", "0061a000002", "0061a000003"])
+
+    assert get_converter("id")(ids).dtype == "string[pyarrow]"
+
+
+def test_repeated_lookups_are_categoricals():
+    lookups = pd.Series(["Acme", "Acme", "Acme", "Globex"])
+
+    assert get_converter("reference")(lookups).dtype == "category"
+
+
+def test_compact_report_pages(mock_login, mock_generate_reports, mock_get_metadata):
+    """Test if pages are concatenated before being converted."""
+    mock_generate_reports(read_json("tabular.json"), n=1)
+    mock_get_metadata(METADATA)
+
+    rf = Reportforce("foo@bar.com", "1234", "token")
+    df = rf.get_report("ID", dtypes="compact")
+
+    assert df["Opportunity Name"].dtype == "category"
+
+
+def test_invalid_dtypes(mock_login):
+    with pytest.raises(ValueError):
+        Reportforce("foo@bar.com", "1234", "token").get_report("ID", dtypes="small")
@@ -1,45 +1,52 @@
-import json
 import pytest
 import requests
 
 from reportforce.helpers.errors import ReportError, handle_error
 
 
-class ResponseWithApiError(requests.Response):
-    text = '[{"errorCode": "errorCode", "message": "message"}]'
+def make_response(content, status_code=400, content_type="application/json"):
+    response = requests.Response()
+    response.status_code = status_code
+    response.headers["Content-Type"] = content_type
+    response._content = content
+    return response
+
+
+API_ERROR = b'[{"errorCode": "errorCode", "message": "message"}]'
 
 
 def test_report_error():
     """Handle_error hook should raise ReportError only for error-like JSON."""
     with pytest.raises(ReportError):
-        handle_error(ResponseWithApiError())
+        handle_error(make_response(API_ERROR))
 
 
 def test_report_error_string_representation():
     """Test ReportError string representation."""
     with pytest.raises(ReportError) as report_error:
-        handle_error(ResponseWithApiError())
+        handle_error(make_response(API_ERROR))
 
     assert str(report_error.value) == "\nCode: errorCode. Message: message"
 
 
-class ResponseWithBinaryContent:
-    text = "\x005"
-
-    def json(self):
-        return json.loads(self.text)
-
-
 def test_report_error_should_not_raise_with_binary_content():
     """Shouldn't raise for responses with binary content."""
-    handle_error(ResponseWithBinaryContent())
-
-
-class ResponseWithInvalidJSON(requests.Response):
-    text = "{invalid: json"
+    handle_error(make_response(b"\x005", content_type="application/octet-stream"))
 
 
 def test_report_error_should_not_raise_with_invalid_json():
     """Shouldn't raise for responses with invalid JSONs."""
+    handle_error(make_response(b"{invalid: json"))
+
+
+class SuccessfulResponse(requests.Response):
+    def json(self):
+        raise AssertionError("Successful responses should not be decoded")
+
+
+def test_successful_response_is_not_decoded():
+    response = SuccessfulResponse()
+    response.status_code = 200
+    response.headers["Content-Type"] = "application/json"
 
-    handle_error(ResponseWithInvalidJSON())
+    handle_error(response)
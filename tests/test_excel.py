@@ -1,4 +1,6 @@
+import io
 import pytest
+import pandas as pd
 
 from reportforce import Reportforce
 from fixtures_utils import read_json
@@ -42,3 +44,75 @@ def test_excel_headers(mock_login):
         "Connection": "keep-alive",
         "Authorization": "Bearer sessionId",
     }
+
+
+def make_spreadsheet(rows):
+    openpyxl = pytest.importorskip("openpyxl")
+
+    workbook = openpyxl.Workbook()
+    for row in rows:
+        workbook.active.append(row)
+
+    spreadsheet = io.BytesIO()
+    workbook.save(spreadsheet)
+    return spreadsheet.getvalue()
+
+
+LABELS = [
+    "Opportunity Name",
+    "Amount",
+    "Lead Source",
+    "Next Step",
+    "Probability (%)",
+    "Fiscal Period",
+    "Age",
+    "Created Date",
+    "Opportunity Owner",
+    "Owner Role",
+]
+
+SPREADSHEET_ROWS = [
+    ["Opportunities Report"],
+    [],
+    [None] + LABELS,
+    [None, "Acme", 16000.01, "Web", None, 60, "Q3-2015", 12, "2015-07-31", "Fred", 1],
+    [None, "Globex", 500, None, "Call", 10, "Q4-2015", 3, "2015-10-01", "Ann", "-"],
+    [],
+    ["Grand Totals (2 records)"],
+]
+
+
+def test_excel_as_dataframe(mock_login, mock_get_metadata, requests_mock):
+    mock_get_metadata(read_json("tabular_metadata.json"))
+
+    requests_mock.post(
+        "https://www.salesforce.com/services/data/v47.0/analytics/reports/ID",
+        content=make_spreadsheet(SPREADSHEET_ROWS),
+    )
+
+    rf = Reportforce("foo@bar.com", "1234", "token")
+    df = rf.get_report("ID", excel_as_dataframe=True)
+
+    assert list(df.columns) == LABELS
+    assert df["Opportunity Name"].tolist() == ["Acme", "Globex"]
+    assert df["Amount"].tolist() == [16000.01, 500]
+    assert df["Age"].tolist() == [12, 3]
+    assert df["Created Date"].tolist() == [
+        pd.Timestamp("2015-07-31"),
+        pd.Timestamp("2015-10-01"),
+    ]
+    assert df["Owner Role"].tolist() == ["1", "-"]
+
+
+def test_excel_header_not_found(mock_login, mock_get_metadata, requests_mock):
+    mock_get_metadata(read_json("tabular_metadata.json"))
+
+    requests_mock.post(
+        "https://www.salesforce.com/services/data/v47.0/analytics/reports/ID",
+        content=make_spreadsheet([["foo", "bar"]]),
+    )
+
+    rf = Reportforce("foo@bar.com", "1234", "token")
+
+    with pytest.raises(ValueError):
+        rf.get_report("ID", excel_as_dataframe=True)
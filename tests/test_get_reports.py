@@ -0,0 +1,85 @@
+import asyncio
+import pytest
+import pandas as pd
+
+from reportforce import AsyncReportforce, Reportforce
+from reportforce.helpers.session import get_pool_size, make_session
+from reportforce.helpers.tabular import Tabular
+
+from fixtures_utils import read_json
+
+REPORT = read_json("tabular.json")
+METADATA = read_json("tabular_metadata.json")
+
+REPORTS = [
+    "ID1",
+    {"report_id": "ID2", "name": "filtered", "filters": [("Age", ">", 1)]},
+    {"report_id": "ID3", "dtypes": "unknown"},
+]
+
+
+@pytest.fixture
+def setup(mock_login, mock_http_request, mock_get_metadata):
+    mock_get_metadata(METADATA)
+    mock_http_request(REPORT, "post")
+
+
+def check_results(results):
+    assert list(results) == ["ID1", "filtered", "ID3"]
+
+    expected = Tabular(REPORT).to_dataframe()
+    pd.testing.assert_frame_equal(results["ID1"], expected)
+    pd.testing.assert_frame_equal(results["filtered"], expected)
+
+    assert isinstance(results["ID3"], Exception)
+
+
+def test_get_reports(setup):
+    calls = []
+
+    rf = Reportforce("foo@bar.com", "1234", "token")
+    results = rf.get_reports(
+        REPORTS, max_workers=2, progress=lambda *args: calls.append(args)
+    )
+
+    check_results(results)
+    assert sorted(calls, key=lambda call: call[1]) == [
+        (calls[0][0], 1, 3),
+        (calls[1][0], 2, 3),
+        (calls[2][0], 3, 3),
+    ]
+
+
+def test_duplicate_names(setup):
+    rf = Reportforce("foo@bar.com", "1234", "token")
+
+    with pytest.raises(ValueError):
+        rf.get_reports(["ID1", {"report_id": "ID2", "name": "ID1"}])
+
+
+def test_pool_grows_to_max_workers(setup):
+    rf = Reportforce("foo@bar.com", "1234", "token", pool_size=2, max_retries=5)
+
+    rf.get_reports(REPORTS, max_workers=16)
+
+    assert get_pool_size(rf.session, rf.url) == 16
+    assert rf.session.get_adapter(rf.url).max_retries.total == 5
+    assert rf.session.get_adapter("http://") is rf.session.get_adapter("https://")
+
+
+def test_small_custom_pool_warns(setup):
+    session = make_session(pool_size=2)
+    rf = Reportforce("foo@bar.com", "1234", "token", session=session)
+
+    with pytest.warns(UserWarning, match="pools 2 connections"):
+        rf.get_reports(REPORTS, max_workers=16)
+
+    assert get_pool_size(session, rf.url) == 2
+
+
+def test_async_get_reports(setup):
+    async def main():
+        async with AsyncReportforce("foo@bar.com", "1234", "token") as rf:
+            return await rf.get_reports(REPORTS)
+
+    check_results(asyncio.run(main()))
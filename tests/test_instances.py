@@ -0,0 +1,86 @@
+import asyncio
+import pytest
+import pandas as pd
+
+from reportforce import AsyncReportforce, Reportforce
+from reportforce.helpers.errors import ReportError
+from reportforce.helpers.tabular import Tabular
+
+from fixtures_utils import read_json
+
+REPORT = read_json("tabular.json")
+METADATA = read_json("tabular_metadata.json")
+
+URL = "https://www.salesforce.com/services/data/v47.0/analytics/reports/ID/instances"
+
+
+def make_instance(status, attributes={}):
+    instance = dict(REPORT)
+    instance["attributes"] = dict(attributes, status=status)
+    return instance
+
+
+@pytest.fixture
+def mock_instances(mock_login, mock_get_metadata, requests_mock, mocker):
+    mock_get_metadata(METADATA)
+    mocker.patch("reportforce.api.time.sleep")
+
+    requests_mock.post(URL, json={"id": "0LGD000000000IjOAI", "status": "New"})
+
+    def _mock_instances(*statuses):
+        return requests_mock.get(
+            URL + "/0LGD000000000IjOAI",
+            [{"json": make_instance(*status)} for status in statuses],
+        )
+
+    return _mock_instances
+
+
+def test_submit_report(mock_instances, requests_mock):
+    rf = Reportforce("foo@bar.com", "1234", "token")
+
+    assert rf.submit_report("ID", filters=[("Age", ">", 1)]) == "0LGD000000000IjOAI"
+    assert requests_mock.last_request.json()["reportMetadata"]["reportFilters"]
+
+
+def test_get_instance(mock_instances):
+    """Test if it polls until the instance finishes and then parses it."""
+    mock_get = mock_instances(["New"], ["Running"], ["Success"])
+
+    rf = Reportforce("foo@bar.com", "1234", "token")
+    df = rf.get_instance("ID", rf.submit_report("ID"))
+
+    assert mock_get.call_count == 3
+    pd.testing.assert_frame_equal(df, Tabular(REPORT).to_dataframe())
+
+
+def test_failed_instance(mock_instances):
+    mock_instances(["Running"], ["Error", {"errorMessage": "Report timed out"}])
+
+    rf = Reportforce("foo@bar.com", "1234", "token")
+
+    with pytest.raises(ReportError, match="Report timed out"):
+        rf.get_instance("ID", "0LGD000000000IjOAI")
+
+
+def test_instance_timeout(mock_instances):
+    mock_instances(["Running"])
+
+    rf = Reportforce("foo@bar.com", "1234", "token")
+
+    with pytest.raises(TimeoutError):
+        rf.get_instance("ID", "0LGD000000000IjOAI", timeout=0)
+
+
+def test_async_instances(mock_instances, mocker):
+    mock_instances(["Running"], ["Success"])
+    mocker.patch("reportforce.aio.asyncio.sleep", mocker.AsyncMock())
+
+    async def main():
+        async with AsyncReportforce("foo@bar.com", "1234", "token") as rf:
+            instance_id = await rf.submit_report("ID")
+            return await rf.get_instance("ID", instance_id)
+
+    df = asyncio.run(main())
+
+    pd.testing.assert_frame_equal(df, Tabular(REPORT).to_dataframe())
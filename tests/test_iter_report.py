@@ -0,0 +1,23 @@
+import pandas as pd
+
+from reportforce import Reportforce
+from reportforce.helpers.tabular import Tabular
+
+from fixtures_utils import read_json
+
+REPORT = read_json("tabular.json")
+METADATA = read_json("tabular_metadata.json")
+
+
+def test_iter_report(mock_login, mock_generate_reports, mock_get_metadata):
+    """Test if it yields one DataFrame per page, lazily."""
+    mock_generate_reports(REPORT, n=1)
+    mock_get_metadata(METADATA)
+
+    rf = Reportforce("foo@bar.com", "1234", "token")
+    pages = rf.iter_report("ID", id_column="Age")
+
+    first_page = next(pages)
+    pd.testing.assert_frame_equal(first_page, Tabular(REPORT).to_dataframe())
+
+    assert [len(df) for df in pages] == [0]
@@ -1,3 +1,4 @@
+import copy
 import pandas as pd
 
 from reportforce.helpers.matrix import Matrix
@@ -23,3 +24,40 @@ def test_empty_matrix(monkeypatch):
     monkeypatch.setitem(MATRIX_REPORT, "factMap", EMPTY_FACTMAP)
 
     assert Matrix(MATRIX_REPORT).to_dataframe().empty
+
+
+def test_matrix_aggregates_are_typed(monkeypatch):
+    """Test if numeric aggregates are stored as numbers, not objects."""
+    aggregate_info = {"rowCount": {"dataType": "double", "label": "Row Sum"}}
+    monkeypatch.setitem(
+        MATRIX_REPORT["reportExtendedMetadata"], "aggregateColumnInfo", aggregate_info
+    )
+
+    matrix_df = Matrix(MATRIX_REPORT).to_dataframe()
+
+    assert (matrix_df.dtypes == "float64").all()
+    assert matrix_df.shape == EXPECTED_MATRIX_DF.shape
+    assert matrix_df.columns.equals(EXPECTED_MATRIX_DF.columns)
+
+
+def test_aggregates_follow_factmap_order():
+    """Test if aggregates are labeled and typed in the order of the report
+    metadata aggregates, which the factMap follows, not the order of
+    aggregateColumnInfo."""
+    report = copy.deepcopy(MATRIX_REPORT)
+    report["reportMetadata"]["aggregates"] = ["s!AMOUNT", "RowCount"]
+    report["reportExtendedMetadata"]["aggregateColumnInfo"] = {
+        "RowCount": {"dataType": "int", "label": "Record Count"},
+        "s!AMOUNT": {"dataType": "double", "label": "Sum of Amount"},
+    }
+    for cell in report["factMap"].values():
+        cell["aggregates"] = [
+            {"label": "1.5", "value": 1.5},
+            {"label": "2", "value": 2},
+        ]
+
+    df = Matrix(report).to_dataframe()
+
+    assert (df["Sum of Amount"] == 1.5).all().all()
+    assert (df["Sum of Amount"].dtypes == "float64").all()
+    assert (df["Record Count"] == 2).all().all()
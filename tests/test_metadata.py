@@ -1,3 +1,5 @@
+import copy
+
 from fixtures_utils import read_json
 from reportforce.helpers.metadata import Metadata
 
@@ -56,6 +58,53 @@ class TestMetadataGetters:
         }
 
 
+class TestColumnsIndex:
+    def test_get_unknown_column(self):
+        assert metadata.get_column_api_name("Unknown") is None
+        assert metadata.get_column_label("UNKNOWN") is None
+
+    def test_detail_columns_come_first(self):
+        """Test if lookups keep the order of all_columns_info."""
+        shadowed = Metadata(copy.deepcopy(metadata))
+        shadowed["reportTypeMetadata"]["categories"][0]["columns"]["SHADOW"] = {
+            "label": "Opportunity Name",
+            "dataType": "picklist",
+        }
+
+        assert shadowed.get_column_api_name("Opportunity Name") == "OPPORTUNITY_NAME"
+        assert shadowed.get_column_dtype("SHADOW") == "picklist"
+
+    def test_index_is_built_once(self, mocker):
+        indexed = Metadata(metadata)
+        indexed.get_column_api_name("Opportunity Name")
+
+        mocker.patch.object(Metadata, "all_columns_info", None)
+        assert indexed.get_column_api_name("Record Count") == "RowCount"
+
+
+class TestOverlay:
+    def test_changes_do_not_leak(self):
+        """Test if changing an overlay leaves the original metadata untouched."""
+        original = Metadata(copy.deepcopy(metadata))
+        expected = copy.deepcopy(original)
+
+        overlay = original.overlay()
+        overlay.report_filters = [("Opportunity Name", "==", "Acme")]
+        overlay.boolean_filter = "1 AND 2"
+        overlay.sort_by = ("Opportunity Name", "desc")
+        overlay.date_start = "01-01-2020"
+        overlay.date_interval = "CUSTOM"
+
+        assert original == expected
+        assert overlay.report_filters[-1]["value"] == '"Acme"'
+
+    def test_describe_is_shared(self):
+        overlay = metadata.overlay()
+
+        assert overlay["reportTypeMetadata"] is metadata["reportTypeMetadata"]
+        assert overlay.columns_index is metadata.columns_index
+
+
 class TestFormatValue:
     def test_format_date(self):
         assert (
@@ -0,0 +1,121 @@
+import pytest
+
+from reportforce import Reportforce, MetadataCache
+from reportforce.helpers import cache as metadata_cache
+
+from fixtures_utils import read_json
+
+METADATA = read_json("tabular_metadata.json")
+METADATA_URL = (
+    "https://www.salesforce.com/services/data/v47.0/analytics/reports/ID/describe"
+)
+KEY = ("www.salesforce.com", "47.0", "ID")
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return MetadataCache(str(tmp_path / "metadata.sqlite"), ttl=60, max_entries=2)
+
+
+def test_get_missing(cache):
+    assert cache.get(*KEY) is None
+    assert cache.stats == {"hits": 0, "misses": 1, "entries": 0}
+
+
+def test_set_and_get(cache):
+    cache.set(*KEY, METADATA)
+
+    assert cache.get(*KEY) == METADATA
+    assert cache.stats == {"hits": 1, "misses": 0, "entries": 1}
+
+
+def test_shared_between_instances(cache):
+    """Another process would see the same entries."""
+    cache.set(*KEY, METADATA)
+
+    assert MetadataCache(cache.path).get(*KEY) == METADATA
+
+
+def test_expired_entry(cache, monkeypatch):
+    cache.set(*KEY, METADATA)
+
+    now = metadata_cache.time.time()
+    monkeypatch.setattr(metadata_cache.time, "time", lambda: now + 61)
+
+    assert cache.get(*KEY) is None
+
+
+def test_evict_least_recently_used(cache, monkeypatch):
+    clock = iter(range(100))
+    monkeypatch.setattr(metadata_cache.time, "time", lambda: next(clock))
+
+    cache.set("url", "47.0", "first", {})
+    cache.set("url", "47.0", "second", {})
+    cache.get("url", "47.0", "first")
+    cache.set("url", "47.0", "third", {})
+
+    assert cache.get("url", "47.0", "second") is None
+    assert cache.get("url", "47.0", "first") == {}
+    assert len(cache) == 2
+
+
+def test_invalidate(cache):
+    cache.set(*KEY, METADATA)
+    cache.set("www.salesforce.com", "47.0", "ANOTHER_ID", METADATA)
+
+    cache.invalidate(report_id="ID")
+    assert len(cache) == 1
+
+    cache.invalidate()
+    assert len(cache) == 0
+
+
+def test_reportforce_uses_cache(mock_login, requests_mock, cache):
+    requests_mock.get(METADATA_URL, json=METADATA)
+
+    Reportforce("foo@bar.com", "1234", "token", metadata_cache=cache).get_metadata(
+        "ID"
+    )
+    Reportforce("foo@bar.com", "1234", "token", metadata_cache=cache).get_metadata(
+        "ID"
+    )
+
+    assert requests_mock.call_count == 1
+    assert cache.stats == {"hits": 1, "misses": 1, "entries": 1}
+
+
+def test_reportforce_invalidate_metadata(mock_login, requests_mock, cache):
+    requests_mock.get(METADATA_URL, json=METADATA)
+
+    rf = Reportforce("foo@bar.com", "1234", "token", metadata_cache=cache)
+    rf.get_metadata("ID")
+    rf.invalidate_metadata("ID")
+    rf.get_metadata("ID")
+
+    assert requests_mock.call_count == 2
+
+
+def test_reportforce_sees_expired_entries(mock_login, requests_mock, cache, monkeypatch):
+    requests_mock.get(METADATA_URL, json=METADATA)
+
+    rf = Reportforce("foo@bar.com", "1234", "token", metadata_cache=cache)
+    rf.get_metadata("ID")
+
+    now = metadata_cache.time.time()
+    monkeypatch.setattr(metadata_cache.time, "time", lambda: now + 61)
+    rf.get_metadata("ID")
+
+    assert requests_mock.call_count == 2
+
+
+def test_reportforce_sees_invalidations_by_others(mock_login, requests_mock, cache):
+    """Another process would invalidate the entry through its own cache."""
+    requests_mock.get(METADATA_URL, json=METADATA)
+
+    rf = Reportforce("foo@bar.com", "1234", "token", metadata_cache=cache)
+    rf.get_metadata("ID")
+
+    MetadataCache(cache.path).invalidate(*KEY)
+    rf.get_metadata("ID")
+
+    assert requests_mock.call_count == 2
@@ -0,0 +1,162 @@
+import copy
+import pytest
+import requests
+import pandas as pd
+
+from reportforce import Reportforce
+from reportforce.helpers.metadata import Metadata
+from reportforce.helpers.pagination import KeysetPaginator, get_paginator
+
+from fixtures_utils import MockJsonResponse, read_json
+
+
+@pytest.fixture
+def paginator():
+    metadata = Metadata(read_json("tabular_metadata.json"))
+    return KeysetPaginator(metadata, "Opportunity Owner")
+
+
+def page(*owners):
+    return pd.DataFrame(
+        {"Opportunity Owner": list(owners), "Age": range(len(owners))}
+    )
+
+
+def test_filter_is_added_once(paginator):
+    paginator.update(page("Ann", "Bob"))
+    paginator.update(page("Bob", "Carl"))
+
+    assert paginator.metadata.report_filters[1:] == [
+        {"column": "FULL_NAME", "operator": "greaterOrEqual", "value": '"Carl"'}
+    ]
+
+
+def test_drop_rows_seen_at_boundary(paginator):
+    paginator.update(page("Ann", "Bob"))
+
+    next_page = pd.DataFrame(
+        {"Opportunity Owner": ["Bob", "Bob", "Carl"], "Age": [1, 2, 0]}
+    )
+
+    assert paginator.drop_seen(next_page)["Age"].tolist() == [2, 0]
+
+
+def test_ties_spanning_many_pages(paginator):
+    paginator.update(page("Ann", "Bob"))
+    paginator.update(paginator.drop_seen(page("Bob", "Bob")))
+
+    assert len(paginator.drop_seen(page("Bob", "Bob", "Bob"))) == 1
+
+
+def test_identical_rows_at_boundary(paginator):
+    """Test if only as many identical rows are dropped as were seen."""
+    paginator.update(
+        pd.DataFrame({"Opportunity Owner": ["Ann", "Bob"], "Age": [0, 1]})
+    )
+
+    next_page = pd.DataFrame({"Opportunity Owner": ["Bob", "Bob"], "Age": [1, 1]})
+
+    assert len(paginator.drop_seen(next_page)) == 1
+
+
+def test_raise_if_last_value_is_null(paginator):
+    with pytest.raises(ValueError):
+        paginator.update(page("Ann", None))
+
+    assert len(paginator.metadata.report_filters) == 1
+
+
+def test_raise_if_pagination_stalls(paginator):
+    paginator.update(page("Ann", "Bob"))
+
+    next_page = pd.DataFrame({"Opportunity Owner": ["Bob"], "Age": [1]})
+
+    with pytest.raises(ValueError):
+        paginator.update(paginator.drop_seen(next_page))
+
+
+SUMMARY_METADATA = {
+    "reportMetadata": {
+        "reportFormat": "SUMMARY",
+        "detailColumns": ["ID"],
+        "groupingsDown": [{"name": "GROUP", "sortOrder": "Asc"}],
+        "reportFilters": [],
+        "reportBooleanFilter": None,
+        "sortBy": [],
+    },
+    "reportExtendedMetadata": {
+        "detailColumnInfo": {
+            "ID": {"label": "Id", "dataType": "string", "isLookup": False}
+        },
+        "aggregateColumnInfo": {},
+        "groupingColumnInfo": {"GROUP": {"label": "Group"}},
+    },
+    "reportTypeMetadata": {"categories": []},
+}
+
+# group "B" has an id lower than the last one of group "A"
+SUMMARY_ROWS = [("A", "5"), ("A", "6"), ("B", "3")]
+
+
+def run_summary(payload, page_size=2):
+    """Run a summary report like Salesforce would: rows are sorted within
+    their group only, filtered and truncated to the page size."""
+    metadata = payload["reportMetadata"]
+    rows = SUMMARY_ROWS
+
+    for report_filter in metadata["reportFilters"]:
+        value = report_filter["value"]
+        if report_filter["operator"] == "notEqual":
+            excluded = value.replace('"', "").split(",")
+            rows = [row for row in rows if row[1] not in excluded]
+        elif report_filter["operator"] == "greaterOrEqual":
+            rows = [row for row in rows if row[1] >= value.strip('"')]
+
+    groups = sorted({group for group, _ in rows})
+    page = rows[:page_size]
+
+    return MockJsonResponse(
+        {
+            "allData": len(rows) <= page_size,
+            "reportMetadata": metadata,
+            "reportExtendedMetadata": SUMMARY_METADATA["reportExtendedMetadata"],
+            "groupingsDown": {
+                "groupings": [{"label": group, "groupings": []} for group in groups]
+            },
+            "factMap": {
+                "{}!T".format(i): {
+                    "rows": [
+                        {"dataCells": [{"label": id_, "value": id_}]}
+                        for group_, id_ in page
+                        if group_ == group
+                    ]
+                }
+                for i, group in enumerate(groups)
+            },
+        }
+    )
+
+
+def test_summary_report_pagination(mock_login, mock_get_metadata, monkeypatch):
+    """Test if no rows are lost paginating a summary report, whose rows are
+    sorted only within each group."""
+    mock_get_metadata(SUMMARY_METADATA)
+    monkeypatch.setattr(
+        requests.Session, "post", lambda self, url, json, **kwargs: run_summary(json)
+    )
+
+    rf = Reportforce("foo@bar.com", "1234", "token")
+    df = rf.get_report("ID", id_column="Id")
+
+    assert sorted(df["Id"]) == ["3", "5", "6"]
+    assert rf.metadata.report_filters == [
+        {"column": "ID", "operator": "notEqual", "value": '"5","6"'}
+    ]
+
+
+def test_lookup_column_on_summary_report():
+    metadata = Metadata(copy.deepcopy(SUMMARY_METADATA))
+    metadata.extended_metadata["detailColumnInfo"]["ID"]["isLookup"] = True
+
+    with pytest.raises(ValueError):
+        get_paginator(metadata, "Id")
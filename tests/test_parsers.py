@@ -20,32 +20,43 @@ class testGetValue:
         assert parsers.get_value(others, "picklist") == "Qualitative"
 
 
-def test_get_groups_labels():
-    assert parsers.get_groups_labels(groups) == [
-        ["grouping1"],
-        ["grouping2"],
-        ["grouping3_1", "grouping3_2"],
-        ["grouping4_1", "grouping4_2"],
+def test_parse_factmap_keys():
+    """Test if totals are filtered out and groups sorted by their indices."""
+    factmap = dict.fromkeys(["10_1!T", "2_0!T", "T!T", "2!T", "10!T", "2_10!T"])
+
+    assert parsers.parse_factmap_keys(factmap, 2, 0) == [
+        ("2_0!T", (2, 0), ()),
+        ("2_10!T", (2, 10), ()),
+        ("10_1!T", (10, 1), ()),
     ]
 
 
-groups = [
-    {
-        "groupings": [
-            {
-                "groupings": [
-                    {
-                        "groupings": [{"groupings": [], "label": "grouping4_1"}],
-                        "label": "grouping3_1",
-                    },
-                    {
-                        "groupings": [{"groupings": [], "label": "grouping4_2"}],
-                        "label": "grouping3_2",
-                    },
-                ],
-                "label": "grouping2",
-            }
-        ],
-        "label": "grouping1",
-    }
-]
+def test_parse_matrix_factmap_keys():
+    factmap = dict.fromkeys(["1!1", "0!T", "1!0", "T!0", "0!1", "T!T", "0!0"])
+
+    assert [key for key, _, _ in parsers.parse_factmap_keys(factmap, 1, 1)] == [
+        "0!0",
+        "0!1",
+        "1!0",
+        "1!1",
+    ]
+
+
+def test_get_groups_levels():
+    """Test if each innermost group gets the codes of its own path."""
+    tree = [
+        {"label": "a", "groupings": [{"label": "x", "groupings": []}]},
+        {
+            "label": "b",
+            "groupings": [
+                {"label": "x", "groupings": []},
+                {"label": "y", "groupings": []},
+            ],
+        },
+    ]
+
+    levels, codes = parsers.get_groups_levels(tree, 2)
+    index = pd.MultiIndex(levels=levels, codes=codes)
+
+    assert levels == [["a", "b"], ["x", "y"]]
+    assert index.tolist() == [("a", "x"), ("b", "x"), ("b", "y")]
@@ -0,0 +1,98 @@
+import requests
+import os
+import pytest
+import pandas as pd
+
+from reportforce import Reportforce, ReportCache
+from reportforce.helpers import cache as report_cache
+
+from fixtures_utils import read_json, MockJsonResponse
+
+pytest.importorskip("pyarrow")
+
+REPORT = read_json("tabular.json")
+METADATA = read_json("tabular_metadata.json")
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return ReportCache(str(tmp_path), ttl=60)
+
+
+@pytest.fixture
+def rf(mock_login, mock_get_metadata, mocker, cache):
+    mock_get_metadata(METADATA)
+    mocker.patch.object(
+        requests.Session, "post", side_effect=lambda *a, **k: MockJsonResponse(REPORT)
+    )
+
+    return Reportforce("foo@bar.com", "1234", "token", report_cache=cache)
+
+
+def test_serve_from_cache(rf, cache):
+    first = rf.get_report("ID")
+    second = rf.get_report("ID")
+
+    pd.testing.assert_frame_equal(first, second)
+    assert rf.session.post.call_count == 1
+    assert cache.stats == {"hits": 1, "misses": 1, "entries": 1}
+
+
+def test_key_depends_on_effective_metadata(rf):
+    rf.get_report("ID")
+    rf.get_report("ID", filters=[("Opportunity Name", "==", "Acme")])
+
+    assert rf.session.post.call_count == 2
+
+
+def test_refresh_cache(rf, cache):
+    rf.get_report("ID")
+    rf.get_report("ID", refresh_cache=True)
+
+    assert rf.session.post.call_count == 2
+    assert len(cache) == 1
+
+
+def test_bypass_cache(rf, cache):
+    rf.get_report("ID", use_cache=False)
+    rf.get_report("ID", use_cache=False)
+
+    assert rf.session.post.call_count == 2
+    assert len(cache) == 0
+
+
+def test_expired_entry(cache, monkeypatch):
+    cache.set("key", pd.DataFrame({"a": [1]}))
+
+    now = report_cache.time.time()
+    monkeypatch.setattr(report_cache.time, "time", lambda: now + 61)
+
+    assert cache.get("key") is None
+    assert len(cache) == 0
+
+
+def test_evict_least_recently_used(cache):
+    df = pd.DataFrame({"a": range(100)})
+
+    for key in ["first", "second", "third"]:
+        cache.set(key, df)
+
+    size = os.stat(cache._get_path("first")).st_size
+    cache.max_size = 2 * size
+
+    os.utime(cache._get_path("first"), (0, 0))
+    cache.evict()
+
+    assert cache.get("first") is None
+    assert len(cache) == 2
+
+
+def test_invalidate(cache):
+    cache.set("first", pd.DataFrame({"a": [1]}))
+    cache.set("second", pd.DataFrame({"a": [1]}))
+
+    cache.invalidate("first")
+    assert len(cache) == 1
+
+    cache.invalidate()
+    assert len(cache) == 0
@@ -0,0 +1,94 @@
+import requests
+import pytest
+import threading
+
+from reportforce import Reportforce
+from fixtures_utils import read_json, MockJsonResponse
+
+REPORT = read_json("tabular.json")
+METADATA = read_json("tabular_metadata.json")
+
+
+@pytest.fixture
+def requested_windows(mock_login, mock_get_metadata, mocker):
+    """
+    Simulate a report whose windows larger than 10 days exceed the row limit,
+    and record every requested window.
+    """
+    mock_get_metadata(METADATA)
+
+    windows = []
+
+    def post(url, json, **kwargs):
+        date_filter = json["reportMetadata"]["standardDateFilter"]
+        window = (date_filter["startDate"][:10], date_filter["endDate"][:10])
+        windows.append(window)
+
+        start, end = (int(date[-2:]) for date in window)
+
+        report = REPORT.copy()
+        report["allData"] = end - start < 10
+        return MockJsonResponse(report)
+
+    mocker.patch.object(requests.Session, "post", side_effect=post)
+
+    return windows
+
+
+def test_date_windows(requested_windows):
+    """Test if windows are split until every one of them fits."""
+    rf = Reportforce("foo@bar.com", "1234", "token")
+    df = rf.get_report("ID", start="01-01-2020", end="31-01-2020", date_windows=2)
+
+    assert requested_windows[:2] == [
+        ("2020-01-01", "2020-01-15"),
+        ("2020-01-16", "2020-01-31"),
+    ]
+    assert sorted(requested_windows[2:]) == [
+        ("2020-01-01", "2020-01-07"),
+        ("2020-01-08", "2020-01-15"),
+        ("2020-01-16", "2020-01-23"),
+        ("2020-01-24", "2020-01-31"),
+    ]
+    assert len(df) == 4
+
+
+def test_date_windows_do_not_change_metadata(requested_windows):
+    """Test if the date filter of the report is left untouched."""
+    rf = Reportforce("foo@bar.com", "1234", "token")
+    rf.get_report("ID", start="01-01-2020", end="31-01-2020", date_windows=2)
+
+    assert rf.metadata.date_filter["startDate"] == "2020-01-01T00:00:00"
+    assert rf.metadata.date_filter["endDate"] == "2020-01-31T00:00:00"
+
+
+def test_date_windows_need_a_date_range(requested_windows):
+    rf = Reportforce("foo@bar.com", "1234", "token")
+
+    with pytest.raises(ValueError):
+        rf.get_report("ID", ignore_date_filter=True, date_windows=2)
+
+
+def test_date_windows_are_streamed(mock_login, mock_get_metadata, mocker):
+    """Test if the first window is yielded while the last one is still being
+    requested."""
+    mock_get_metadata(METADATA)
+
+    first_page_yielded = threading.Event()
+    timed_out = []
+
+    def post(url, json, **kwargs):
+        if json["reportMetadata"]["standardDateFilter"]["startDate"] > "2020-01-15":
+            timed_out.append(not first_page_yielded.wait(1))
+        return MockJsonResponse(REPORT)
+
+    mocker.patch.object(requests.Session, "post", side_effect=post)
+
+    rf = Reportforce("foo@bar.com", "1234", "token")
+    pages = rf.iter_report("ID", start="01-01-2020", end="31-01-2020", date_windows=2)
+
+    next(pages)
+    first_page_yielded.set()
+
+    assert len(list(pages)) == 1
+    assert timed_out == [False]
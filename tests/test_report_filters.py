@@ -18,7 +18,7 @@ def setup(mock_login, mock_generate_reports, mock_get_metadata):
     mock_get_metadata(METADATA)
 
     rf = Reportforce("foo@bar.com", "1234", "token")
-    rf.get_report(
+    rf.report = rf.get_report(
         "ID",
         filters=[("Opportunity Name", "!=", "00112233")],
         logic="1 AND 2",
@@ -33,8 +33,8 @@ def setup(mock_login, mock_generate_reports, mock_get_metadata):
 
 def test_logic(setup):
     """
-    Test if the filter was incremented one times due
-    to filtering out already seen values.
+    Test if the filter was incremented one time due
+    to paginating past the last seen value.
     """
     assert len(setup.metadata.report_filters) == 3
     assert setup.metadata.boolean_filter == "1 AND 2 AND 3"
@@ -56,7 +56,7 @@ def test_report_filters(setup):
     """
     Test if a filter was added due
     1. to user-specified filter
-    2. to filtering out already seen values.
+    2. to paginating past the last seen value.
     """
     assert setup.metadata.report_filters == [
         {
@@ -69,12 +69,23 @@ def test_report_filters(setup):
         {"column": "OPPORTUNITY_NAME", "operator": "notEqual", "value": '"00112233"'},
         {
             "column": "OPPORTUNITY_NAME",
-            "operator": "notEqual",
+            "operator": "greaterOrEqual",
             "value": '"Acme - 200 Widgets"',
         },
     ]
 
 
+def test_sort_by(setup):
+    assert setup.metadata.sort_by == [
+        {"sortColumn": "OPPORTUNITY_NAME", "sortOrder": "Asc"}
+    ]
+
+
+def test_seen_rows_are_dropped(setup):
+    """The row at the boundary of the first page must not be repeated."""
+    assert len(setup.report) == 1
+
+
 def test_ignore_date_filter(mock_login, mock_get_metadata, mock_http_request):
     """Test if specifying ignore_date_filter removes the standard date filter."""
     mock_get_metadata(METADATA)
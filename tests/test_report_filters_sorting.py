@@ -34,7 +34,7 @@ def test_report_filters(setup):
         },
         {
             "column": "FULL_NAME",
-            "operator": "greaterThan",
+            "operator": "greaterOrEqual",
             "value": '"Fred Wiliamson"',
         },
     ]
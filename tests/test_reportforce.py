@@ -26,3 +26,20 @@ def test_get_metadata(mock_login, requests_mock):
 
     metadata = Reportforce("fake@username.com", "pass", "token").get_metadata("ID")
     assert isinstance(metadata, Metadata)
+
+
+def test_run_payload(mock_login, mock_get_metadata, requests_mock):
+    """Test if only the report metadata is sent to run a report."""
+    metadata = read_json("tabular_metadata.json")
+    mock_get_metadata(metadata)
+
+    requests_mock.post(
+        "https://www.salesforce.com/services/data/v47.0/analytics/reports/ID",
+        json=read_json("tabular.json"),
+    )
+
+    Reportforce("fake@username.com", "pass", "token").get_report("ID")
+
+    assert requests_mock.last_request.json() == {
+        "reportMetadata": metadata["reportMetadata"]
+    }
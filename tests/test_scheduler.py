@@ -0,0 +1,146 @@
+import time
+import requests
+import threading
+
+from reportforce import Reportforce
+from reportforce.helpers.scheduler import (
+    DEFAULT_PRIORITY,
+    Scheduler,
+    TokenBucket,
+    get_scheduler,
+)
+from reportforce.helpers.session import ScheduledSession
+
+from fixtures_utils import read_json
+
+
+def test_token_bucket():
+    bucket = TokenBucket(capacity=2, period=1)
+
+    assert bucket.consume() == 0
+    assert bucket.consume() == 0
+    assert 0 < bucket.consume() <= 0.5
+
+
+def test_rate_limit():
+    scheduler = Scheduler(rate_limit=1, period=0.1, max_concurrency=None)
+
+    start = time.monotonic()
+    for _ in range(3):
+        with scheduler.slot():
+            pass
+
+    assert time.monotonic() - start >= 0.2
+
+
+def test_priority_and_concurrency():
+    """Test if waiting requests run one at a time, by priority then order."""
+    scheduler = Scheduler(rate_limit=None, max_concurrency=1)
+    order = []
+
+    def request(priority, name):
+        with scheduler.slot(priority):
+            order.append(name)
+
+    scheduler.acquire()
+
+    threads = []
+    for priority, name in [(10, "low"), (0, "high"), (10, "low2"), (5, "medium")]:
+        thread = threading.Thread(target=request, args=(priority, name))
+        thread.start()
+        threads.append(thread)
+
+        # wait for it to be queued
+        while len(scheduler._queue) < len(threads):
+            time.sleep(0.001)
+
+    scheduler.release()
+
+    for thread in threads:
+        thread.join()
+
+    assert order == ["high", "medium", "low", "low2"]
+    assert scheduler.running == 0
+
+
+def test_scheduler_is_shared_by_org():
+    rf1 = Reportforce(session_id="id1", instance_url="org1.salesforce.com")
+    rf2 = Reportforce(session_id="id2", instance_url="org1.salesforce.com")
+    rf3 = Reportforce(session_id="id3", instance_url="org2.salesforce.com")
+
+    assert isinstance(rf1.session, ScheduledSession)
+    assert rf1.session.scheduler is rf2.session.scheduler
+    assert rf1.session.scheduler is get_scheduler("org1.salesforce.com")
+    assert rf1.session.scheduler is not rf3.session.scheduler
+
+
+def test_custom_scheduler():
+    scheduler = Scheduler(max_concurrency=2)
+    rf = Reportforce(
+        session_id="id", instance_url="org.salesforce.com", scheduler=scheduler
+    )
+
+    assert rf.session.scheduler is scheduler
+
+
+def test_priority_is_passed_through(mocker, requests_mock):
+    scheduler = Scheduler()
+    slot = mocker.spy(scheduler, "slot")
+    requests_mock.get("https://org.salesforce.com/foo", json={})
+
+    rf = Reportforce(
+        session_id="id", instance_url="org.salesforce.com", scheduler=scheduler
+    )
+    rf.session.get("https://org.salesforce.com/foo", priority=1)
+
+    slot.assert_called_once_with(1)
+
+
+def test_only_report_runs_are_scheduled(mocker, requests_mock):
+    """Test if describes skip the scheduler while report runs go through it."""
+    scheduler = Scheduler()
+    slot = mocker.spy(scheduler, "slot")
+
+    rf = Reportforce(
+        session_id="id", instance_url="org.salesforce.com", scheduler=scheduler
+    )
+    url = rf._get_report_url("ID")
+
+    requests_mock.get(url + "/describe", json=read_json("tabular_metadata.json"))
+    requests_mock.post(url, json=read_json("tabular.json"))
+
+    rf.get_report("ID")
+
+    slot.assert_called_once_with(DEFAULT_PRIORITY)
+
+
+def test_excel_exports_are_scheduled(mocker, requests_mock):
+    """Test if Excel exports, which are report runs too, go through the
+    scheduler with the given priority."""
+    scheduler = Scheduler()
+    slot = mocker.spy(scheduler, "slot")
+
+    rf = Reportforce(
+        session_id="id", instance_url="org.salesforce.com", scheduler=scheduler
+    )
+    url = rf._get_report_url("ID")
+
+    requests_mock.get(url + "/describe", json=read_json("tabular_metadata.json"))
+    requests_mock.post(url, content=b"1,2,3")
+    mocker.patch("builtins.open", mocker.mock_open())
+
+    rf.get_report("ID", excel="file.xlsx", priority=3)
+
+    slot.assert_called_once_with(3)
+
+
+def test_priority_with_custom_session(requests_mock):
+    rf = Reportforce(
+        session_id="id", instance_url="org.salesforce.com", session=requests.Session()
+    )
+    url = rf._get_report_url("ID")
+
+    requests_mock.get(url + "/describe", json=read_json("tabular_metadata.json"))
+    requests_mock.post(url, json=read_json("tabular.json"))
+
+    assert len(rf.get_report("ID", priority=0)) == 1
@@ -0,0 +1,112 @@
+import threading
+import contextlib
+import http.server
+
+from reportforce import AsyncReportforce, Reportforce
+from reportforce.helpers.session import Retry, make_session
+
+
+def get_adapter(session):
+    return session.get_adapter("https://www.salesforce.com")
+
+
+def test_sessions_are_not_shared():
+    rf1 = Reportforce(session_id="id1", instance_url="org1.salesforce.com")
+    rf2 = Reportforce(session_id="id2", instance_url="org2.salesforce.com")
+
+    assert rf1.session is not rf2.session
+    assert rf1.session.headers["Authorization"] == "Bearer id1"
+    assert rf2.session.headers["Authorization"] == "Bearer id2"
+
+
+def test_pool_size_and_retries():
+    rf = Reportforce(
+        session_id="id", instance_url="org.salesforce.com", pool_size=20, max_retries=5
+    )
+    adapter = get_adapter(rf.session)
+
+    assert adapter._pool_maxsize == 20
+    assert adapter.max_retries.total == 5
+    assert "POST" in adapter.max_retries.allowed_methods
+    assert 503 in adapter.max_retries.status_forcelist
+
+
+def test_keep_alive():
+    assert make_session().headers["Connection"] == "keep-alive"
+    assert make_session(keep_alive=False).headers["Connection"] == "close"
+
+
+def test_error_hook_is_added_once():
+    session = make_session()
+
+    Reportforce(session_id="id", instance_url="org.salesforce.com", session=session)
+    Reportforce(session_id="id", instance_url="org.salesforce.com", session=session)
+
+    assert len(session.hooks["response"]) == 1
+
+
+def test_async_pool_fits_max_concurrency():
+    rf = AsyncReportforce(
+        session_id="id", instance_url="org.salesforce.com", max_concurrency=32
+    )
+
+    assert get_adapter(rf.session)._pool_maxsize == 32
+
+
+def test_backoff_jitter():
+    retry = Retry(total=5, backoff_factor=1, jitter=0.5)
+    assert retry.get_backoff_time() == 0
+
+    retry = retry.increment(method="GET").increment(method="GET")
+    assert retry.jitter == 0.5
+    assert 2 <= retry.get_backoff_time() <= 2.5
+
+
+@contextlib.contextmanager
+def serve(statuses):
+    """Serve POST requests on a local server, answering with the given
+    statuses in order, and yield its URL."""
+
+    class Handler(http.server.BaseHTTPRequestHandler):
+        def do_POST(self):
+            self.send_response(statuses.pop(0))
+            self.send_header("Retry-After", "0")
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+
+        def log_message(self, *args):
+            pass
+
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever)
+    thread.start()
+
+    try:
+        yield "http://127.0.0.1:{}".format(server.server_port)
+    finally:
+        server.shutdown()
+        server.server_close()
+        thread.join()
+
+
+def test_throttled_requests_are_retried():
+    """Test if 429 responses are retried, waiting as long as Retry-After says."""
+    statuses = [429, 200]
+
+    with serve(statuses) as url:
+        response = make_session().post(url + "/reports/ID", json={})
+
+    assert response.status_code == 200
+    assert statuses == []
+
+
+def test_instance_runs_are_not_retried():
+    """Test if posting an asynchronous run is not retried, which would start
+    it twice."""
+    statuses = [503, 200]
+
+    with serve(statuses) as url:
+        response = make_session().post(url + "/reports/ID/instances", json={})
+
+    assert response.status_code == 503
+    assert statuses == [200]
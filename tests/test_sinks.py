@@ -0,0 +1,123 @@
+import io
+import pytest
+import pandas as pd
+
+from reportforce import Reportforce
+from reportforce.helpers import sinks
+from reportforce.helpers.metadata import Metadata
+
+from fixtures_utils import read_json
+
+REPORT = read_json("tabular.json")
+METADATA = read_json("tabular_metadata.json")
+
+
+@pytest.fixture
+def rf(mock_login, mock_generate_reports, mock_get_metadata):
+    """Simulate a report with two pages."""
+    mock_generate_reports(REPORT, n=1)
+    mock_get_metadata(METADATA)
+
+    return Reportforce("foo@bar.com", "1234", "token")
+
+
+def test_fields_from_metadata():
+    assert sinks.get_fields(Metadata(METADATA))[:2] == [
+        ("Opportunity Name", "string"),
+        ("Amount", "currency"),
+    ]
+
+
+def test_csv_sink_file_object(rf):
+    buffer = io.StringIO()
+    n_rows = rf.get_report("ID", id_column="Age", sink=buffer)
+
+    lines = buffer.getvalue().splitlines()
+    assert n_rows == 1
+    assert lines[0].startswith("Opportunity Name,Amount,")
+    assert len(lines) == 2
+
+
+def test_csv_sink_path(rf, tmp_path):
+    path = tmp_path / "report.csv"
+    rf.get_report("ID", sink=str(path))
+
+    assert pd.read_csv(path)["Opportunity Name"].tolist() == ["Acme - 200 Widgets"]
+
+
+def test_parquet_sink(rf, tmp_path):
+    pq = pytest.importorskip("pyarrow.parquet")
+
+    path = tmp_path / "report.parquet"
+    rf.get_report("ID", sink=path)
+
+    parquet_file = pq.ParquetFile(str(path))
+    schema = parquet_file.schema_arrow
+
+    assert schema.field("Age").type == "int64"
+    assert schema.field("Amount").type == "double"
+    assert parquet_file.metadata.num_rows == 1
+
+
+SUMMARY_METADATA = {
+    "reportMetadata": {
+        "reportFormat": "SUMMARY",
+        "detailColumns": ["ID", "AMOUNT"],
+        "groupingsDown": [{"name": "OWNER"}],
+    },
+    "reportExtendedMetadata": {
+        "detailColumnInfo": {
+            "ID": {"label": "Id", "dataType": "string"},
+            "AMOUNT": {"label": "Amount", "dataType": "double"},
+        },
+        "aggregateColumnInfo": {},
+        "groupingColumnInfo": {"OWNER": {"label": "Owner"}},
+    },
+    "reportTypeMetadata": {"categories": []},
+}
+
+
+def summary_page():
+    index = pd.MultiIndex.from_tuples([("Ann",), ("Bob",)], names=["Owner"])
+    return pd.DataFrame({"Id": ["a", "b"], "Amount": [1.0, 2.0]}, index=index)
+
+
+def test_summary_csv_sink():
+    buffer = io.StringIO()
+    sink = sinks.get_sink(buffer, Metadata(SUMMARY_METADATA))
+
+    sink.write(summary_page())
+
+    assert buffer.getvalue().splitlines() == [
+        "Owner,Id,Amount",
+        "Ann,a,1.0",
+        "Bob,b,2.0",
+    ]
+
+
+def test_summary_parquet_sink(tmp_path):
+    pq = pytest.importorskip("pyarrow.parquet")
+
+    path = tmp_path / "report.parquet"
+    sinks.write_pages(sinks.get_sink(path, Metadata(SUMMARY_METADATA)), [summary_page()])
+
+    table = pq.read_table(str(path))
+    assert table.column_names == ["Owner", "Id", "Amount"]
+    assert table.column("Owner").to_pylist() == ["Ann", "Bob"]
+
+
+def test_csv_sink_aligns_columns():
+    buffer = io.StringIO()
+    sink = sinks.get_sink(buffer, Metadata(SUMMARY_METADATA))
+
+    sink.write(summary_page()[["Amount", "Id"]])
+
+    assert buffer.getvalue().splitlines()[1] == "Ann,a,1.0"
+
+    with pytest.raises(KeyError):
+        sink.write(summary_page()[["Id"]])
+
+
+def test_matrix_is_not_supported():
+    with pytest.raises(ValueError):
+        sinks.get_fields(Metadata(read_json("matrix.json")))
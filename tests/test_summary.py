@@ -22,3 +22,31 @@ def test_empty_summary(monkeypatch):
     monkeypatch.setitem(SUMMARY_REPORT, "factMap", EMPTY_FACTMAP)
 
     assert Summary(SUMMARY_REPORT).to_dataframe().empty
+
+
+def test_more_than_ten_groups():
+    """Test if groups with multi-digit indices are kept and ordered."""
+    labels = ["group{}".format(i) for i in range(12)]
+
+    report = {
+        "reportMetadata": {"reportFormat": "SUMMARY", "groupingsDown": [{"name": "G"}]},
+        "reportExtendedMetadata": {
+            "detailColumnInfo": {"C": {"dataType": "int", "label": "Value"}},
+            "groupingColumnInfo": {"G": {"label": "Group"}},
+        },
+        "groupingsDown": {
+            "groupings": [{"label": label, "groupings": []} for label in labels]
+        },
+        "factMap": {
+            "T!T": {"rows": []},
+            **{
+                "{}!T".format(i): {"rows": [{"dataCells": [{"value": i}]}]}
+                for i in reversed(range(12))
+            },
+        },
+    }
+
+    df = Summary(report).to_dataframe()
+
+    assert df.index.tolist() == [(label,) for label in labels]
+    assert df["Value"].tolist() == list(range(12))
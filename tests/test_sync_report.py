@@ -0,0 +1,104 @@
+import requests
+import pytest
+import pandas as pd
+
+from reportforce import Reportforce
+from reportforce.helpers.store import ReportStore
+
+from fixtures_utils import read_json, MockJsonResponse
+
+REPORT = read_json("tabular.json")
+METADATA = read_json("tabular_metadata.json")
+
+
+@pytest.fixture
+def rf(mock_login, mock_get_metadata, mocker):
+    mock_get_metadata(METADATA)
+    mocker.patch.object(
+        requests.Session, "post", side_effect=lambda *a, **k: MockJsonResponse(REPORT)
+    )
+
+    return Reportforce("foo@bar.com", "1234", "token")
+
+
+def sync(rf, path):
+    return rf.sync_report(
+        "ID",
+        str(path),
+        id_column="Opportunity Name",
+        modified_column="Created Date",
+        ignore_date_filter=True,
+    )
+
+
+def test_first_sync_gets_everything(rf, tmp_path):
+    sync(rf, tmp_path / "store.sqlite")
+
+    store = ReportStore(str(tmp_path / "store.sqlite"), "ID")
+    assert store.high_water_mark == pd.Timestamp("2015-07-31")
+    assert len(store.read()) == 1
+
+
+def test_next_sync_starts_from_high_water_mark(rf, tmp_path):
+    sync(rf, tmp_path / "store.sqlite")
+    rf.sync_report(
+        "ID",
+        str(tmp_path / "store.sqlite"),
+        id_column="Opportunity Name",
+        modified_column="Created Date",
+    )
+
+    assert rf.metadata.date_filter["column"] == "CREATED_DATE"
+    assert rf.metadata.date_filter["startDate"] == "2015-07-30"
+    assert len(ReportStore(str(tmp_path / "store.sqlite"), "ID").read()) == 1
+
+
+def test_high_water_mark_overrides_date_options(rf, tmp_path):
+    """Test if the same arguments can be passed on every sync."""
+    for _ in range(2):
+        sync(rf, tmp_path / "store.sqlite")
+
+    assert rf.metadata.date_filter["column"] == "CREATED_DATE"
+    assert rf.metadata.date_filter["startDate"] == "2015-07-30"
+
+
+def test_start_covers_timezones_west_of_utc():
+    """A row modified right after the high-water mark may still be on the day
+    before in the org timezone."""
+    high_water_mark = pd.Timestamp("2020-01-02 03:00", tz="UTC")
+    options = Reportforce._get_sync_options(high_water_mark, "Modified", {})
+
+    local_date = high_water_mark.tz_convert("America/Los_Angeles").date()
+    assert options["start"] <= local_date
+
+
+def test_upsert_replaces_rows(tmp_path):
+    store = ReportStore(str(tmp_path / "store.sqlite"), "report")
+
+    df = pd.DataFrame(
+        {
+            "Id": ["a", "b"],
+            "Amount": [1.0, 2.0],
+            "Modified": pd.to_datetime(["2020-01-01", "2020-01-02"]),
+        }
+    )
+    store.upsert(df, "Id", "Modified")
+
+    changed = pd.DataFrame(
+        {"Id": ["b", "c"], "Amount": [3.0, 4.0], "Modified": pd.to_datetime(["2020-01-03"] * 2)}
+    )
+    store.upsert(changed, "Id", "Modified")
+
+    stored = store.read().sort_values("Id")
+    assert stored["Amount"].tolist() == [1.0, 3.0, 4.0]
+    assert store.high_water_mark == pd.Timestamp("2020-01-03")
+
+
+def test_high_water_mark_never_goes_back(tmp_path):
+    store = ReportStore(str(tmp_path / "store.sqlite"), "report")
+
+    for day in ["2020-01-02", "2020-01-01"]:
+        df = pd.DataFrame({"Id": [day], "Modified": [pd.Timestamp(day)]})
+        store.upsert(df, "Id", "Modified")
+
+    assert store.high_water_mark == pd.Timestamp("2020-01-02")
@@ -1,5 +1,6 @@
 import pandas as pd
 
+from reportforce.helpers import parsers
 from reportforce.helpers.tabular import Tabular
 
 from fixtures_utils import read_json
@@ -23,3 +24,24 @@ def test_empty_tabular(monkeypatch):
     monkeypatch.setitem(TABULAR_REPORT, "factMap", EMPTY_FACTMAP)
 
     assert Tabular(TABULAR_REPORT).to_dataframe().empty
+
+
+def test_columns_match_cell_by_cell_parsing(monkeypatch):
+    """Test if converting whole columns gives the same as converting each cell."""
+    row = TABULAR_REPORT["factMap"]["T!T"]["rows"][0]
+    missing = {"dataCells": [{"label": "-", "value": None}] * len(row["dataCells"])}
+    rows = [row, missing, row]
+
+    monkeypatch.setitem(TABULAR_REPORT, "factMap", {"T!T": {"rows": rows}})
+    report = Tabular(TABULAR_REPORT)
+
+    dtypes = report.get_columns_dtypes()
+    expected = pd.DataFrame(
+        [
+            [parsers.get_value(cell, dtype) for cell, dtype in zip(r["dataCells"], dtypes)]
+            for r in rows
+        ],
+        columns=report.get_columns_labels(),
+    )
+
+    pd.testing.assert_frame_equal(expected, report.to_dataframe())
@@ -1,5 +1,7 @@
 import pandas as pd
 
+from datetime import date
+
 from reportforce.helpers import utils
 
 
@@ -29,3 +31,23 @@ class TestSurroundWithQuotes:
 
     def test_surround_with_quotes_string(self):
         assert utils.surround_with_quotes(1) == '"1"'
+
+
+class TestSplitDateRange:
+    def test_split_evenly(self):
+        assert utils.split_date_range(date(2020, 1, 1), date(2020, 1, 4), 2) == [
+            (date(2020, 1, 1), date(2020, 1, 2)),
+            (date(2020, 1, 3), date(2020, 1, 4)),
+        ]
+
+    def test_split_unevenly(self):
+        assert utils.split_date_range(date(2020, 1, 1), date(2020, 1, 3), 2) == [
+            (date(2020, 1, 1), date(2020, 1, 1)),
+            (date(2020, 1, 2), date(2020, 1, 3)),
+        ]
+
+    def test_more_windows_than_days(self):
+        assert utils.split_date_range(date(2020, 1, 1), date(2020, 1, 2), 5) == [
+            (date(2020, 1, 1), date(2020, 1, 1)),
+            (date(2020, 1, 2), date(2020, 1, 2)),
+        ]